@@ -0,0 +1,105 @@
+import sys
+import timeit
+
+from pyhalboy.codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+)
+from pyhalboy.resource import Resource
+
+
+def create_collection(count: int) -> Resource:
+    return (
+        Resource()
+        .add_link("self", "/orders?page=1")
+        .add_link("next", "/orders?page=2")
+        .add_property("total", count * 10)
+        .add_resources_bulk(
+            "ea:order",
+            (
+                Resource()
+                .add_link("self", "/orders/{}".format(i))
+                .add_link("ea:customer", "/customers/{}".format(i % 97))
+                .add_link("ea:basket", "/baskets/{}".format(i))
+                .add_properties(
+                    {
+                        "id": i,
+                        "state": "dispatching",
+                        "total": i * 1.25,
+                        "currency": "GBP",
+                        "tags": ["priority", "gift"],
+                    }
+                )
+                for i in range(count)
+            ),
+        )
+    )
+
+
+def create_codecs() -> dict[str, JsonCodec]:
+    codecs: dict[str, JsonCodec] = {"stdlib": StdlibJsonCodec()}
+    for name, codec in [("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)]:
+        try:
+            codecs[name] = codec()
+        except ImportError:
+            print("{} is not installed, skipping".format(name))
+    return codecs
+
+
+def main(count: int = 1000, repeat: int = 5, number: int = 20) -> None:
+    collection = create_collection(count)
+    body = StdlibJsonCodec().dumps(collection.to_object())
+
+    print(
+        "HAL collection with {} embedded orders, {} KiB".format(
+            count, len(body) // 1024
+        )
+    )
+    print(
+        "{:<10}{:>10}{:>10}{:>16}{:>14}".format(
+            "codec", "loads ms", "dumps ms", "from_json ms", "to_json ms"
+        )
+    )
+
+    document = collection.to_object()
+
+    for name, codec in create_codecs().items():
+        loads = min(
+            timeit.repeat(
+                lambda: codec.loads(body), repeat=repeat, number=number
+            )
+        )
+        dumps = min(
+            timeit.repeat(
+                lambda: codec.dumps(document), repeat=repeat, number=number
+            )
+        )
+        decode = min(
+            timeit.repeat(
+                lambda: Resource.from_json(body, codec=codec),
+                repeat=repeat,
+                number=number,
+            )
+        )
+        encode = min(
+            timeit.repeat(
+                lambda: collection.to_json(codec),
+                repeat=repeat,
+                number=number,
+            )
+        )
+        print(
+            "{:<10}{:>10.2f}{:>10.2f}{:>16.2f}{:>14.2f}".format(
+                name,
+                loads / number * 1000,
+                dumps / number * 1000,
+                decode / number * 1000,
+                encode / number * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
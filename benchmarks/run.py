@@ -0,0 +1,328 @@
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import timeit
+
+from collections.abc import Callable
+
+import httpx
+
+from pyhalboy.navigator import Navigator, SettingsDict
+from pyhalboy.resource import Resource
+
+# Scores are run time divided by the time of a fixed calibration loop
+# timed right before each sample, so machine speed and load cancel out and
+# baselines are comparable across machines and runs.
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_TOLERANCE = 0.4
+
+type Benchmark = Callable[[], Callable[[], object]]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(fn: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = fn
+        return fn
+
+    return register
+
+
+def create_wide_object(count: int) -> dict[str, object]:
+    return {
+        "_links": {
+            "self": {"href": "/orders"},
+            "ea:order": [
+                {"href": "/orders/{}".format(i), "title": "Order {}".format(i)}
+                for i in range(count)
+            ],
+        },
+        **{"property-{}".format(i): i for i in range(count)},
+        "_embedded": {
+            "ea:order": [
+                {
+                    "_links": {"self": {"href": "/orders/{}".format(i)}},
+                    "id": i,
+                    "state": "dispatching",
+                }
+                for i in range(count)
+            ]
+        },
+    }
+
+
+def create_large_object(links: int, embedded: int) -> dict[str, object]:
+    return {
+        "_links": {
+            "self": {"href": "/items"},
+            "item": [{"href": "/items/{}".format(i)} for i in range(links)],
+        },
+        "count": embedded,
+        "_embedded": {
+            "item": [
+                {
+                    "_links": {"self": {"href": "/items/{}".format(i)}},
+                    "id": i,
+                    "name": "Item {}".format(i),
+                }
+                for i in range(embedded)
+            ]
+        },
+    }
+
+
+def create_deep_object(depth: int) -> dict[str, object]:
+    document: dict[str, object] = {"_links": {"self": {"href": "/leaf"}}}
+    for i in range(depth):
+        document = {
+            "_links": {"self": {"href": "/level/{}".format(i)}},
+            "level": i,
+            "_embedded": {"child": document},
+        }
+    return document
+
+
+@benchmark("resource.from_object.wide")
+def from_object_wide():
+    document = create_wide_object(1000)
+    return lambda: Resource.from_object(document)
+
+
+@benchmark("resource.from_object.deep")
+def from_object_deep():
+    document = create_deep_object(200)
+    return lambda: Resource.from_object(document)
+
+
+@benchmark("resource.from_object.wide.trusted")
+def from_object_wide_trusted():
+    document = create_wide_object(1000)
+    return lambda: Resource.from_object(document, trusted=True)
+
+
+@benchmark("resource.from_object.deep.trusted")
+def from_object_deep_trusted():
+    document = create_deep_object(200)
+    return lambda: Resource.from_object(document, trusted=True)
+
+
+@benchmark("resource.from_object.large")
+def from_object_large():
+    document = create_large_object(1000, 10000)
+    return lambda: Resource.from_object(document)
+
+
+@benchmark("resource.from_object.large.trusted")
+def from_object_large_trusted():
+    document = create_large_object(1000, 10000)
+    return lambda: Resource.from_object(document, trusted=True)
+
+
+@benchmark("resource.embedded_columns.large")
+def embedded_columns_large():
+    document = create_large_object(1000, 10000)
+
+    def extract() -> object:
+        resource = Resource.from_object(document, lazy=True)
+        return resource.embedded_columns("item", ["id", "name"], ["self"])
+
+    return extract
+
+
+@benchmark("resource.to_object.wide")
+def to_object_wide():
+    resource = Resource.from_object(create_wide_object(1000))
+    return resource.to_object
+
+
+@benchmark("resource.to_object.deep")
+def to_object_deep():
+    resource = Resource.from_object(create_deep_object(200))
+    return resource.to_object
+
+
+@benchmark("resource.add_link.loop")
+def add_link_loop():
+    hrefs = ["/items/{}".format(i) for i in range(2000)]
+
+    def build():
+        resource = Resource()
+        for href in hrefs:
+            resource.add_link("item", href)
+        return resource
+
+    return build
+
+
+@benchmark("resource.add_resource.loop")
+def add_resource_loop():
+    items = [Resource().add_property("id", i) for i in range(2000)]
+
+    def build():
+        resource = Resource()
+        for item in items:
+            resource.add_resource("item", item)
+        return resource
+
+    return build
+
+
+@benchmark("resource.add_links_bulk")
+def add_links_bulk():
+    hrefs = ["/items/{}".format(i) for i in range(2000)]
+    return lambda: Resource().add_links_bulk("item", hrefs)
+
+
+@benchmark("resource.get_href.multi")
+def get_href_multi():
+    resource = Resource().add_links_bulk(
+        "item", ["/items/{}".format(i) for i in range(1000)]
+    )
+    return lambda: resource.get_href("item")
+
+
+@benchmark("resource.get_link.multi")
+def get_link_multi():
+    resource = Resource.from_object(create_wide_object(1000))
+    return lambda: resource.get_link("ea:order")
+
+
+def create_settings() -> SettingsDict:
+    root = json.dumps(
+        {
+            "_links": {
+                "self": {"href": "/"},
+                "users": {"href": "/users"},
+                "user": {"href": "/users/{id}", "templated": True},
+            }
+        }
+    ).encode()
+    users = json.dumps(create_wide_object(100)).encode()
+    user = json.dumps(
+        {"_links": {"self": {"href": "/users/fred"}}, "name": "Fred"}
+    ).encode()
+    headers = {"content-type": "application/json"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, headers=headers, content=user)
+        if request.url.path == "/":
+            return httpx.Response(200, headers=headers, content=root)
+        if request.url.path == "/users":
+            return httpx.Response(200, headers=headers, content=users)
+        return httpx.Response(200, headers=headers, content=user)
+
+    return {"client": httpx.Client(transport=httpx.MockTransport(handler))}
+
+
+@benchmark("navigator.discover")
+def navigator_discover():
+    settings = create_settings()
+    return lambda: Navigator.discover("http://test.com/", settings)
+
+
+@benchmark("navigator.get")
+def navigator_get():
+    navigator = Navigator.discover("http://test.com/", create_settings())
+    return lambda: navigator.get("user", {"id": "fred"}).resource()
+
+
+@benchmark("navigator.get.collection")
+def navigator_get_collection():
+    navigator = Navigator.discover("http://test.com/", create_settings())
+    return lambda: navigator.get("users").resource().get_href("self")
+
+
+@benchmark("navigator.post")
+def navigator_post():
+    navigator = Navigator.discover("http://test.com/", create_settings())
+    return lambda: navigator.post("users", {"name": "Fred"}).status()
+
+
+def calibrate() -> object:
+    total = 0
+    items: list[dict[str, object]] = []
+    for i in range(2000):
+        total += i % 7
+        items.append({"id": i, "name": "item-{}".format(i)})
+    return total, items
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    gc.collect()
+    number, _ = timeit.Timer(fn).autorange()
+    calibration_number, _ = timeit.Timer(calibrate).autorange()
+
+    ratios: list[float] = []
+    for _ in range(repeat):
+        calibration = (
+            timeit.timeit(calibrate, number=calibration_number)
+            / calibration_number
+        )
+        elapsed = timeit.timeit(fn, number=number) / number
+        ratios.append(elapsed / calibration)
+
+    return statistics.median(ratios)
+
+
+def run(names: list[str], repeat: int) -> dict[str, float]:
+    return {name: measure(BENCHMARKS[name](), repeat) for name in names}
+
+
+def load_baseline() -> dict[str, float]:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as file:
+        return json.load(file)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark pyhalboy hot paths against stored baselines."
+    )
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results = run(args.names, args.repeat)
+    baseline = load_baseline()
+    regressions: list[str] = []
+
+    print(
+        "{:<40}{:>12}{:>12}{:>10}".format("name", "score", "baseline", "ratio")
+    )
+    for name, score in results.items():
+        reference = baseline.get(name)
+        ratio = score / reference if reference else None
+        print(
+            "{:<40}{:>12.3f}{:>12}{:>10}".format(
+                name,
+                score,
+                "{:.3f}".format(reference) if reference else "-",
+                "{:.2f}".format(ratio) if ratio else "-",
+            )
+        )
+        if ratio is not None and ratio > 1 + args.tolerance:
+            regressions.append(name)
+
+    if args.save:
+        with open(BASELINE_PATH, "w") as file:
+            json.dump({**baseline, **results}, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    if args.compare and regressions:
+        print("regressions: {}".format(", ".join(regressions)))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
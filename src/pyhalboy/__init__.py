@@ -1,2 +1,10 @@
 from .resource import Resource as Resource
+from .resource import FrozenResource as FrozenResource
+from .link import Link as Link
 from .navigator import Navigator as Navigator
+from .async_navigator import AsyncNavigator as AsyncNavigator
+from .session import NavigatorSession as NavigatorSession
+from .session import AsyncNavigatorSession as AsyncNavigatorSession
+from .plan import NavigationPlan as NavigationPlan
+from .plan import AsyncNavigationPlan as AsyncNavigationPlan
+from .plan import PlanStep as PlanStep
@@ -0,0 +1,462 @@
+import asyncio
+
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from typing import Literal, overload
+
+from httpx import URL, AsyncClient, Response
+
+from .cache import CacheLookup, DiscoveryLookup
+from .navigator import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PREFETCH,
+    JSON_HEADERS,
+    BaseNavigator,
+    BaseSettings,
+    BaseSettingsDict,
+    Exchange,
+    HttpSettings,
+    PostResult,
+    discovery_headers,
+    make_absolute,
+    resolve_settings,
+    url_with_params,
+)
+from .resource import Resource
+from .streaming import EmbeddedStreamParser
+from .tracing import Timings
+from .types import Href, JsonValue, LinkRel, ResourceRel
+
+
+AsyncSettingsDict = BaseSettingsDict[AsyncClient]
+AsyncSettings = BaseSettings[AsyncClient]
+
+
+def _default_settings(client: AsyncClient | None = None) -> AsyncSettings:
+    return AsyncSettings(
+        http=HttpSettings(headers={}),
+        client=client if client is not None else AsyncClient(),
+    )
+
+
+async def _send(
+    *,
+    method: str,
+    url: URL,
+    content: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    settings: AsyncSettings,
+    timings: Timings,
+    stream: bool = False,
+) -> Response:
+    exchange = Exchange(
+        settings.client.build_request(
+            method, url, content=content, headers=headers
+        ),
+        settings,
+        timings,
+    )
+
+    while True:
+        exchange.start()
+        try:
+            response = await settings.client.send(
+                exchange.request, stream=stream
+            )
+        except Exception as e:
+            delay = exchange.failed(e)
+            if delay is None:
+                raise
+        else:
+            delay = exchange.completed(response)
+            if delay is None:
+                return response
+            await response.aclose()
+        finally:
+            exchange.finish()
+
+        await asyncio.sleep(delay)
+
+
+async def _get_url(
+    *,
+    url: Href,
+    params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
+    settings: AsyncSettings,
+    timings: Timings,
+) -> Response:
+    return await _send(
+        method="GET",
+        url=url_with_params(url, params),
+        headers=headers,
+        settings=settings,
+        timings=timings,
+    )
+
+
+async def _post_url(
+    *,
+    url: Href,
+    body: JsonValue,
+    params: Mapping[str, str] | None = None,
+    settings: AsyncSettings,
+    timings: Timings,
+) -> Response:
+    return await _send(
+        method="POST",
+        url=url_with_params(url, params),
+        content=settings.codec.dumps(body),
+        headers=JSON_HEADERS,
+        settings=settings,
+        timings=timings,
+    )
+
+
+async def _get_navigator(
+    *,
+    url: Href,
+    params: Mapping[str, str] | None = None,
+    settings: AsyncSettings,
+    timings: Timings | None = None,
+) -> "AsyncNavigator":
+    timings = timings if timings is not None else Timings()
+    lookup = CacheLookup(settings.cache, url, params)
+
+    entry = lookup.fresh_entry()
+    if entry is None:
+        response = await _get_url(
+            url=url,
+            params=params,
+            headers=lookup.conditional_headers(),
+            settings=settings,
+            timings=timings,
+        )
+        entry = lookup.revalidated(response)
+
+        if entry is None:
+            navigator = AsyncNavigator(
+                settings=settings, response=response, timings=timings
+            )
+            lookup.store(response, navigator.resource)
+            return navigator
+
+    return AsyncNavigator(
+        settings=settings,
+        response=entry.to_response(),
+        resource=entry.resource,
+        timings=timings,
+    )
+
+
+class AsyncNavigator(BaseNavigator):
+    _settings: AsyncSettings
+
+    def __init__(
+        self,
+        settings: AsyncSettings,
+        response: Response | None,
+        resource: Resource | None = None,
+        timings: Timings | None = None,
+        location: Href = "",
+    ):
+        super().__init__(response, resource, settings.codec, timings, location)
+        self._settings = settings
+
+    def request_headers(self) -> dict[str, str]:
+        return self._settings.request_headers()
+
+    def _embedded_navigator(
+        self,
+        rel: LinkRel,
+        href: Href,
+        params: Mapping[str, str],
+        timings: Timings | None = None,
+    ) -> "AsyncNavigator | None":
+        if not self._settings.prefer_embedded:
+            return None
+
+        resource = self._find_embedded(rel, href, params)
+        if resource is None:
+            return None
+
+        return AsyncNavigator(
+            settings=self._settings,
+            response=None,
+            resource=resource,
+            timings=timings,
+            location=href,
+        )
+
+    @staticmethod
+    async def discover(url: Href, settings: AsyncSettingsDict = {}):
+        client = settings.get("client")
+        lookup = DiscoveryLookup(
+            settings.get("discovery_cache"), url, discovery_headers(settings)
+        )
+
+        entry = lookup.entry()
+        if entry is not None:
+            if client is None and isinstance(entry.client, AsyncClient):
+                client = entry.client
+            return AsyncNavigator(
+                settings=resolve_settings(_default_settings(client), settings),
+                response=entry.response,
+                resource=entry.resource,
+            )
+
+        resolved_settings = resolve_settings(
+            _default_settings(client), settings
+        )
+        navigator = await _get_navigator(
+            url=url, params={}, settings=resolved_settings
+        )
+        if navigator._response is not None:
+            lookup.store(
+                navigator._response,
+                navigator.resource,
+                resolved_settings.client,
+            )
+
+        return navigator
+
+    async def get(
+        self, rel: LinkRel, params: Mapping[str, str] | None = None
+    ) -> "AsyncNavigator":
+        timings = Timings()
+        href, resolved_params = self._resolve_link(
+            rel=rel, params=params, timings=timings
+        )
+
+        embedded = self._embedded_navigator(
+            rel, href, resolved_params, timings
+        )
+        if embedded is not None:
+            return embedded
+
+        return await _get_navigator(
+            url=href,
+            params=resolved_params,
+            settings=self._settings,
+            timings=timings,
+        )
+
+    async def follow(self, href: Href) -> "AsyncNavigator":
+        return await _get_navigator(
+            url=make_absolute(self._location, href), settings=self._settings
+        )
+
+    async def get_all(
+        self,
+        rel: LinkRel,
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list["AsyncNavigator | Exception"]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def follow(link: tuple[str, Mapping[str, str]]):
+            href, resolved_params = link
+            embedded = self._embedded_navigator(rel, href, resolved_params)
+            if embedded is not None:
+                return embedded
+
+            async with semaphore:
+                try:
+                    return await _get_navigator(
+                        url=href,
+                        params=resolved_params,
+                        settings=self._settings,
+                    )
+                except Exception as e:
+                    return e
+
+        links = self._resolve_links(rel=rel, params=params)
+
+        return list(await asyncio.gather(*(follow(link) for link in links)))
+
+    async def iter_pages(
+        self, next_rel: LinkRel = "next", prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncGenerator["AsyncNavigator"]:
+        async def fetch_next(
+            previous: Awaitable["AsyncNavigator | None"],
+        ) -> "AsyncNavigator | None":
+            page = await previous
+            if page is None or not page.resource().has_link(next_rel):
+                return None
+            return await page.get(next_rel)
+
+        tail: asyncio.Future[AsyncNavigator | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        tail.set_result(self)
+        pending = deque([tail])
+
+        try:
+            while True:
+                while len(pending) <= prefetch:
+                    tail = asyncio.ensure_future(fetch_next(tail))
+                    pending.append(tail)
+
+                page = await pending.popleft()
+                if page is None:
+                    return
+
+                yield page
+        finally:
+            for task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()
+                task.cancel()
+
+    async def iter_items(
+        self,
+        embedded_rel: ResourceRel,
+        next_rel: LinkRel = "next",
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[Resource]:
+        pages = self.iter_pages(next_rel=next_rel, prefetch=prefetch)
+
+        try:
+            async for page in pages:
+                for item in page._embedded_items(embedded_rel):
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def stream_embedded(
+        self,
+        rel: LinkRel,
+        embedded_rel: ResourceRel | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> AsyncIterator[Resource]:
+        href, resolved_params = self._resolve_link(rel=rel, params=params)
+        parser = EmbeddedStreamParser(
+            embedded_rel if embedded_rel is not None else rel,
+            self._settings.codec,
+        )
+
+        response = await _send(
+            method="GET",
+            url=url_with_params(href, resolved_params),
+            settings=self._settings,
+            timings=Timings(),
+            stream=True,
+        )
+        try:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield Resource.from_object(item, lazy=True)
+        finally:
+            await response.aclose()
+
+    async def post(
+        self,
+        rel: LinkRel,
+        body: JsonValue,
+        params: Mapping[str, str] | None = None,
+    ) -> "AsyncNavigator":
+        timings = Timings()
+        href, resolved_params = self._resolve_link(
+            rel=rel, params=params, timings=timings
+        )
+
+        return AsyncNavigator(
+            settings=self._settings,
+            response=await _post_url(
+                url=href,
+                body=body,
+                params=resolved_params,
+                settings=self._settings,
+                timings=timings,
+            ),
+            timings=timings,
+        )
+
+    @overload
+    async def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: Literal[True] = True,
+    ) -> list["AsyncNavigator | Exception"]: ...
+
+    @overload
+    async def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: Literal[False],
+    ) -> list[PostResult | Exception]: ...
+
+    async def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: bool = True,
+    ) -> Sequence["AsyncNavigator | PostResult | Exception"]:
+        href, resolved_params = self._resolve_link(rel=rel, params=params)
+
+        async def send(
+            body: JsonValue,
+        ) -> "AsyncNavigator | PostResult | Exception":
+            timings = Timings()
+            try:
+                response = await _post_url(
+                    url=href,
+                    body=body,
+                    params=resolved_params,
+                    settings=self._settings,
+                    timings=timings,
+                )
+                if not parse:
+                    return PostResult.from_response(response)
+
+                return AsyncNavigator(
+                    settings=self._settings,
+                    response=response,
+                    timings=timings,
+                )
+            except Exception as e:
+                return e
+
+        results: dict[int, AsyncNavigator | PostResult | Exception] = {}
+        pending: dict[
+            asyncio.Task[AsyncNavigator | PostResult | Exception], int
+        ] = {}
+
+        try:
+            for index, body in enumerate(bodies):
+                pending[asyncio.ensure_future(send(body))] = index
+                if len(pending) >= max_concurrency:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        results[pending.pop(task)] = task.result()
+
+            if pending:
+                await asyncio.wait(pending)
+            for task, index in pending.items():
+                results[index] = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return [results[index] for index in range(len(results))]
@@ -0,0 +1,452 @@
+import hashlib
+import os
+import tempfile
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Any, Protocol, cast
+
+from httpx import URL, AsyncClient, Client, Headers, Request, Response
+
+from .codec import JsonCodec, default_codec
+from .resource import Resource
+from .types import Href, StatusCode
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_DISCOVERY_TTL = 300.0
+DEFAULT_DISCOVERY_MAX_ENTRIES = 256
+REVALIDATION_HEADERS = (
+    "cache-control",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+)
+
+
+@dataclass(frozen=True)
+class CacheEntry(object):
+    url: Href
+    status_code: StatusCode
+    headers: list[tuple[str, str]]
+    resource: Resource
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = Headers(self.headers)
+        conditional: dict[str, str] = {}
+
+        if "etag" in headers:
+            conditional["if-none-match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["if-modified-since"] = headers["last-modified"]
+
+        return conditional
+
+    def to_response(self) -> Response:
+        return Response(
+            self.status_code,
+            headers=self.headers,
+            request=Request("GET", self.url),
+        )
+
+    def to_object(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": [[name, value] for name, value in self.headers],
+            "resource": self.resource.to_object(),
+            "expires_at": self.expires_at,
+        }
+
+    @staticmethod
+    def from_object(value: Any) -> "CacheEntry":
+        if not isinstance(value, dict):
+            raise ValueError("Malformed cache entry")
+
+        entry = cast(dict[str, Any], value)
+        url = entry["url"]
+        status_code = entry["status_code"]
+        headers = entry["headers"]
+        resource = entry["resource"]
+        expires_at = entry["expires_at"]
+
+        if not (
+            isinstance(url, str)
+            and isinstance(status_code, int)
+            and isinstance(headers, list)
+            and isinstance(resource, dict)
+            and isinstance(expires_at, (int, float))
+        ):
+            raise ValueError("Malformed cache entry")
+
+        return CacheEntry(
+            url=url,
+            status_code=status_code,
+            headers=[
+                (str(name), str(value))
+                for name, value in cast(list[tuple[Any, Any]], headers)
+            ],
+            resource=Resource.from_object(
+                cast(dict[str, Any], resource)
+            ).freeze(),
+            expires_at=float(expires_at),
+        )
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend(object):
+    _entries: OrderedDict[str, CacheEntry]
+    _max_entries: int
+    _lock: Lock
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheBackend(object):
+    _directory: str
+    _codec: JsonCodec
+
+    def __init__(self, directory: str, codec: JsonCodec | None = None):
+        self._directory = directory
+        self._codec = codec if codec is not None else default_codec()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, digest)
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._path(key), "rb") as file:
+                return CacheEntry.from_object(self._codec.loads(file.read()))
+        except Exception:
+            return None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        descriptor, temp_path = tempfile.mkstemp(dir=self._directory)
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(self._codec.dumps(entry.to_object()))
+        os.replace(temp_path, self._path(key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            os.remove(os.path.join(self._directory, name))
+
+
+def _cache_directives(headers: Headers) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+
+    return directives
+
+
+def _expires_at(headers: Headers, now: float) -> float:
+    directives = _cache_directives(headers)
+
+    if "no-cache" in directives:
+        return now
+
+    max_age = directives.get("max-age")
+    if max_age is not None and max_age.isdigit():
+        return now + int(max_age)
+
+    expires = headers.get("expires")
+    if expires is not None:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return now
+
+    return now
+
+
+def _is_storable(response: Response) -> bool:
+    headers = response.headers
+    directives = _cache_directives(headers)
+
+    if response.status_code != 200 or "no-store" in directives:
+        return False
+
+    return (
+        "etag" in headers
+        or "last-modified" in headers
+        or "max-age" in directives
+        or "expires" in headers
+    )
+
+
+class ResponseCache(object):
+    _backend: CacheBackend
+
+    def __init__(self, backend: CacheBackend | None = None):
+        self._backend = (
+            backend if backend is not None else InMemoryCacheBackend()
+        )
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    def key(self, url: Href, params: Mapping[str, str] | None) -> str:
+        return str(URL(url).copy_merge_params(params or {}))
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        return self._backend.get(key)
+
+    def store(self, key: str, response: Response, resource: Resource) -> None:
+        if not _is_storable(response):
+            return
+
+        self._backend.set(
+            key,
+            CacheEntry(
+                url=str(response.url),
+                status_code=response.status_code,
+                headers=response.headers.multi_items(),
+                resource=resource.freeze(),
+                expires_at=_expires_at(response.headers, time.time()),
+            ),
+        )
+
+    def revalidated(
+        self, key: str, entry: CacheEntry, response: Response
+    ) -> CacheEntry:
+        headers = Headers(entry.headers)
+        for name in REVALIDATION_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+
+        refreshed = replace(
+            entry,
+            headers=headers.multi_items(),
+            expires_at=_expires_at(headers, time.time()),
+        )
+        self._backend.set(key, refreshed)
+
+        return refreshed
+
+    def invalidate(self, key: str) -> None:
+        self._backend.delete(key)
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+
+class CacheLookup(object):
+    _cache: ResponseCache | None
+    _key: str
+    _entry: CacheEntry | None
+
+    def __init__(
+        self,
+        cache: ResponseCache | None,
+        url: Href,
+        params: Mapping[str, str] | None,
+    ):
+        self._cache = cache
+        self._key = cache.key(url, params) if cache is not None else ""
+        self._entry = cache.lookup(self._key) if cache is not None else None
+
+    def fresh_entry(self) -> CacheEntry | None:
+        if self._entry is not None and self._entry.is_fresh(time.time()):
+            return self._entry
+
+        return None
+
+    def conditional_headers(self) -> dict[str, str] | None:
+        if self._entry is None:
+            return None
+
+        return self._entry.conditional_headers()
+
+    def revalidated(self, response: Response) -> CacheEntry | None:
+        if (
+            self._cache is None
+            or self._entry is None
+            or response.status_code != 304
+        ):
+            return None
+
+        return self._cache.revalidated(self._key, self._entry, response)
+
+    def store(
+        self, response: Response, resource: Callable[[], Resource]
+    ) -> None:
+        if self._cache is None or not _is_storable(response):
+            return
+
+        try:
+            parsed = resource()
+        except Exception:
+            return
+
+        self._cache.store(self._key, response, parsed)
+
+
+type DiscoveryKey = tuple[Href, tuple[tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class DiscoveryEntry(object):
+    response: Response
+    resource: Resource
+    expires_at: float
+    client: Client | AsyncClient | None = None
+
+
+class DiscoveryCache(object):
+    _entries: OrderedDict[DiscoveryKey, DiscoveryEntry]
+    _ttl: float
+    _max_entries: int
+    _lock: Lock
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DISCOVERY_TTL,
+        max_entries: int = DEFAULT_DISCOVERY_MAX_ENTRIES,
+    ):
+        self._entries = OrderedDict()
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, url: Href, headers: Mapping[str, str]) -> DiscoveryKey:
+        return url, tuple(
+            sorted((name.lower(), value) for name, value in headers.items())
+        )
+
+    def lookup(self, key: DiscoveryKey) -> DiscoveryEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self,
+        key: DiscoveryKey,
+        response: Response,
+        resource: Resource,
+        client: Client | AsyncClient | None = None,
+    ) -> None:
+        now = time.monotonic()
+
+        with self._lock:
+            self._entries[key] = DiscoveryEntry(
+                response=response,
+                resource=resource.freeze(),
+                expires_at=now + self._ttl,
+                client=client,
+            )
+            self._entries.move_to_end(key)
+
+            for expired in [
+                stored
+                for stored, entry in self._entries.items()
+                if entry.expires_at <= now
+            ]:
+                del self._entries[expired]
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: Href | None = None) -> None:
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == url]:
+                del self._entries[key]
+
+
+class DiscoveryLookup(object):
+    _cache: DiscoveryCache | None
+    _key: DiscoveryKey
+
+    def __init__(
+        self,
+        cache: DiscoveryCache | None,
+        url: Href,
+        headers: Mapping[str, str],
+    ):
+        self._cache = cache
+        self._key = cache.key(url, headers) if cache is not None else (url, ())
+
+    def entry(self) -> DiscoveryEntry | None:
+        if self._cache is None:
+            return None
+
+        return self._cache.lookup(self._key)
+
+    def store(
+        self,
+        response: Response,
+        resource: Callable[[], Resource],
+        client: Client | AsyncClient,
+    ) -> None:
+        if self._cache is not None and response.is_success:
+            self._cache.store(self._key, response, resource(), client)
@@ -0,0 +1,62 @@
+import json
+
+from functools import cache
+from importlib import import_module
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    def loads(self, data: bytes | bytearray | str) -> Any: ...
+
+    def dumps(self, value: Any) -> bytes: ...
+
+
+class StdlibJsonCodec(object):
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(object):
+    _orjson: Any
+
+    def __init__(self):
+        self._orjson = import_module("orjson")
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+
+class MsgspecCodec(object):
+    _decoder: Any
+    _encoder: Any
+
+    def __init__(self):
+        msgspec_json = import_module("msgspec.json")
+        self._decoder = msgspec_json.Decoder()
+        self._encoder = msgspec_json.Encoder()
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+
+STDLIB_CODEC = StdlibJsonCodec()
+
+
+@cache
+def default_codec() -> JsonCodec:
+    for codec in [OrjsonCodec, MsgspecCodec]:
+        try:
+            return codec()
+        except ImportError:
+            continue
+
+    return STDLIB_CODEC
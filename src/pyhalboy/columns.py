@@ -0,0 +1,65 @@
+from array import array
+from collections.abc import Mapping, Sequence
+from importlib import import_module
+from typing import Any, Literal, cast
+
+from .link import Link
+from .types import Href, LinkRel
+
+type ColumnFormat = Literal["list", "array", "numpy", "arrow"]
+type Column = list[Any] | array[Any]
+type ColumnSource = tuple[Mapping[str, Any], Mapping[LinkRel, Any]]
+
+
+def first_href(value: Any) -> Href | None:
+    if isinstance(value, list):
+        values = cast(list[Any], value)
+        value = values[0] if values else None
+    if isinstance(value, Link):
+        return value.href
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return cast(dict[str, Any], value).get("href")
+    return None
+
+
+def compact_column(values: list[Any]) -> Column:
+    if values and all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if values and all(type(value) in (int, float) for value in values):
+        return array("d", values)
+    return values
+
+
+def build_columns(
+    sources: Sequence[ColumnSource],
+    fields: Sequence[str],
+    hrefs: Sequence[LinkRel],
+    format: ColumnFormat,
+) -> Any:
+    columns: dict[str, list[Any]] = {
+        field: [properties.get(field) for properties, _ in sources]
+        for field in fields
+    }
+    for rel in hrefs:
+        columns[rel] = [first_href(links.get(rel)) for _, links in sources]
+
+    if format == "list":
+        return columns
+    if format == "array":
+        return {
+            name: compact_column(values) for name, values in columns.items()
+        }
+    if format == "numpy":
+        numpy = import_module("numpy")
+        return {
+            name: numpy.asarray(values) for name, values in columns.items()
+        }
+    if format == "arrow":
+        return import_module("pyarrow").table(columns)
+
+    raise ValueError('Unknown column format "{}"'.format(format))
@@ -0,0 +1,238 @@
+import asyncio
+import time
+
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Collection,
+    Generator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from threading import Lock
+from urllib.parse import urldefrag
+
+from httpx import URL
+
+from .async_navigator import AsyncNavigator
+from .navigator import (
+    DEFAULT_MAX_CONCURRENCY,
+    BaseNavigator,
+    Navigator,
+    make_absolute,
+)
+from .resource import Resource
+from .types import Href
+
+DEFAULT_MAX_DEPTH = 3
+
+type CrawlResult = tuple[Href, Resource]
+type ErrorHandler = Callable[[Href, Exception], None]
+
+
+class CrawlError(Exception):
+    def __init__(self, url: Href, status: int | None):
+        super().__init__('Crawling "{}" returned {}'.format(url, status))
+        self.url = url
+        self.status = status
+
+
+class HostRateLimiter(object):
+    def __init__(
+        self,
+        rate: float | None = None,
+        host_rates: Mapping[str, float] = {},
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._rate = rate
+        self._host_rates = dict(host_rates)
+        self._clock = clock
+        self._next_slots: dict[str, float] = {}
+        self._lock = Lock()
+
+    def reserve(self, host: str) -> float:
+        rate = self._host_rates.get(host, self._rate)
+        if rate is None:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slots.get(host, now))
+            self._next_slots[host] = slot + 1 / rate
+            return slot - now
+
+
+class CrawlFrontier(object):
+    def __init__(
+        self, start: Href, max_depth: int, hosts: Collection[str] | None
+    ):
+        self._max_depth = max_depth
+        self._hosts = hosts if hosts is not None else {URL(start).host}
+        self._queue: deque[tuple[Href, int]] = deque()
+        self._seen = {self._key(start)}
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _key(self, url: Href) -> Href:
+        return urldefrag(url).url
+
+    def _claim(self, url: Href) -> bool:
+        key = self._key(url)
+        if key in self._seen:
+            return False
+
+        self._seen.add(key)
+        return True
+
+    def pop(self) -> tuple[Href, int]:
+        return self._queue.popleft()
+
+    def visit(
+        self, url: Href, resource: Resource, depth: int
+    ) -> list[CrawlResult]:
+        results: list[CrawlResult] = [(url, resource)]
+        pending = [(url, resource, depth)]
+
+        while pending:
+            base, current, current_depth = pending.pop()
+            if current_depth >= self._max_depth:
+                continue
+
+            for links in current.get_links().values():
+                for link in links if isinstance(links, Sequence) else [links]:
+                    if link.get("templated"):
+                        continue
+
+                    target = make_absolute(base, link["href"])
+                    if URL(target).host in self._hosts and self._claim(target):
+                        self._queue.append((target, current_depth + 1))
+
+            for embedded in current.get_resources().values():
+                for item in (
+                    embedded if isinstance(embedded, Sequence) else [embedded]
+                ):
+                    item_url = base
+                    if item.has_link("self"):
+                        self_href = item.get_href("self")
+                        if isinstance(self_href, Href):
+                            item_url = make_absolute(base, self_href)
+                            if self._claim(item_url):
+                                results.append((item_url, item))
+                    pending.append((item_url, item, current_depth + 1))
+
+        return results
+
+
+class BaseCrawler(object):
+    def __init__(
+        self,
+        *,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_workers: int = DEFAULT_MAX_CONCURRENCY,
+        hosts: Collection[str] | None = None,
+        rate_limit: float | None = None,
+        host_rate_limits: Mapping[str, float] = {},
+        on_error: ErrorHandler | None = None,
+    ):
+        self._max_depth = max_depth
+        self._max_workers = max_workers
+        self._hosts = hosts
+        self._rate_limiter = HostRateLimiter(rate_limit, host_rate_limits)
+        self._on_error = on_error
+
+    def _frontier(self, start: BaseNavigator) -> CrawlFrontier:
+        return CrawlFrontier(start.location(), self._max_depth, self._hosts)
+
+    def _delay(self, url: Href) -> float:
+        return self._rate_limiter.reserve(URL(url).host)
+
+    def _check(self, url: Href, page: BaseNavigator) -> Resource:
+        status = page.status()
+        if status is not None and not 200 <= status < 300:
+            raise CrawlError(url, status)
+
+        return page.resource()
+
+    def _report(self, url: Href, error: Exception) -> None:
+        if self._on_error is not None:
+            self._on_error(url, error)
+
+
+class Crawler(BaseCrawler):
+    def crawl(self, navigator: Navigator) -> Generator[CrawlResult]:
+        frontier = self._frontier(navigator)
+        yield from frontier.visit(
+            navigator.location(), navigator.resource(), 0
+        )
+
+        def fetch(url: Href) -> Resource:
+            time.sleep(self._delay(url))
+            return self._check(url, navigator.follow(url))
+
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        pending: dict[Future[Resource], tuple[Href, int]] = {}
+
+        try:
+            while frontier or pending:
+                while frontier and len(pending) < self._max_workers:
+                    url, depth = frontier.pop()
+                    pending[executor.submit(fetch, url)] = (url, depth)
+
+                done, _ = wait_futures(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = pending.pop(future)
+                    try:
+                        resource = future.result()
+                    except Exception as e:
+                        self._report(url, e)
+                        continue
+
+                    yield from frontier.visit(url, resource, depth)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+class AsyncCrawler(BaseCrawler):
+    async def crawl(
+        self, navigator: AsyncNavigator
+    ) -> AsyncGenerator[CrawlResult]:
+        frontier = self._frontier(navigator)
+        for result in frontier.visit(
+            navigator.location(), navigator.resource(), 0
+        ):
+            yield result
+
+        async def fetch(url: Href) -> Resource:
+            await asyncio.sleep(self._delay(url))
+            return self._check(url, await navigator.follow(url))
+
+        pending: dict[asyncio.Task[Resource], tuple[Href, int]] = {}
+
+        try:
+            while frontier or pending:
+                while frontier and len(pending) < self._max_workers:
+                    url, depth = frontier.pop()
+                    pending[asyncio.ensure_future(fetch(url))] = (url, depth)
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    url, depth = pending.pop(task)
+                    try:
+                        resource = task.result()
+                    except Exception as e:
+                        self._report(url, e)
+                        continue
+
+                    for result in frontier.visit(url, resource, depth):
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,176 @@
+import json
+
+from collections.abc import Mapping, Sequence
+from typing import Any, NotRequired, TypedDict, cast
+
+from .types import Href, LinkRel
+
+LINK_ATTRIBUTES = (
+    "templated",
+    "type",
+    "deprecation",
+    "name",
+    "profile",
+    "title",
+    "hreflang",
+)
+
+
+class LinkDict(TypedDict):
+    href: Href
+    title: NotRequired[str]
+    templated: NotRequired[bool]
+    type: NotRequired[str]
+    deprecation: NotRequired[str]
+    name: NotRequired[str]
+    profile: NotRequired[str]
+    hreflang: NotRequired[str]
+
+
+class Link(object):
+    __slots__ = ("href", *LINK_ATTRIBUTES, "extra")
+
+    href: Href
+    templated: bool | None
+    type: str | None
+    deprecation: str | None
+    name: str | None
+    profile: str | None
+    title: str | None
+    hreflang: str | None
+    extra: dict[str, Any] | None
+
+    def __init__(
+        self,
+        href: Href,
+        *,
+        templated: bool | None = None,
+        type: str | None = None,
+        deprecation: str | None = None,
+        name: str | None = None,
+        profile: str | None = None,
+        title: str | None = None,
+        hreflang: str | None = None,
+        extra: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.href = href
+        self.templated = templated
+        self.type = type
+        self.deprecation = deprecation
+        self.name = name
+        self.profile = profile
+        self.title = title
+        self.hreflang = hreflang
+        self.extra = dict(extra) if extra else None
+
+    @staticmethod
+    def from_dict(link_dict: Mapping[str, Any]) -> "Link":
+        link = Link(link_dict["href"])
+        if len(link_dict) == 1:
+            return link
+
+        extra: dict[str, Any] | None = None
+
+        for key, value in link_dict.items():
+            if key == "href":
+                continue
+            if key in LINK_ATTRIBUTES and value is not None:
+                setattr(link, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+
+        link.extra = extra
+        return link
+
+    def to_dict(self) -> LinkDict:
+        link_dict: dict[str, Any] = {"href": self.href}
+
+        if self.templated is not None:
+            link_dict["templated"] = self.templated
+        if self.type is not None:
+            link_dict["type"] = self.type
+        if self.deprecation is not None:
+            link_dict["deprecation"] = self.deprecation
+        if self.name is not None:
+            link_dict["name"] = self.name
+        if self.profile is not None:
+            link_dict["profile"] = self.profile
+        if self.title is not None:
+            link_dict["title"] = self.title
+        if self.hreflang is not None:
+            link_dict["hreflang"] = self.hreflang
+        if self.extra is not None:
+            link_dict.update(self.extra)
+
+        return cast(LinkDict, link_dict)
+
+    def to_json(self) -> str:
+        parts = ['"href": ', json.dumps(self.href)]
+
+        for attribute in LINK_ATTRIBUTES:
+            value = getattr(self, attribute)
+            if value is not None:
+                parts += [", ", json.dumps(attribute), ": ", json.dumps(value)]
+
+        if self.extra is not None:
+            for key, value in self.extra.items():
+                parts += [", ", json.dumps(key), ": ", json.dumps(value)]
+
+        return "{" + "".join(parts) + "}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Link):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(self.href)
+
+    def __repr__(self) -> str:
+        return "Link({!r})".format(self.to_dict())
+
+
+class LinkIndex(object):
+    __slots__ = ("hrefs", "names", "titles", "rels")
+
+    hrefs: dict[LinkRel, Href | tuple[Href, ...]]
+    names: dict[tuple[LinkRel, str], Link]
+    titles: dict[tuple[LinkRel, str], Link]
+    rels: dict[Href, list[LinkRel]]
+
+    def __init__(self, links: Mapping[LinkRel, Link | Sequence[Link]]):
+        self.hrefs = {}
+        self.names = {}
+        self.titles = {}
+        self.rels = {}
+
+        for rel, value in links.items():
+            self.add(rel, value)
+
+    def add(self, rel: LinkRel, value: Link | Sequence[Link]) -> None:
+        rel_links = value if isinstance(value, Sequence) else [value]
+
+        for link in rel_links:
+            if link.name is not None:
+                self.names.setdefault((rel, link.name), link)
+            if link.title is not None:
+                self.titles.setdefault((rel, link.title), link)
+
+            rels = self.rels.setdefault(link.href, [])
+            if rel not in rels:
+                rels.append(rel)
+
+        current = self.hrefs.get(rel)
+        if current is None:
+            self.hrefs[rel] = (
+                tuple(link.href for link in rel_links)
+                if isinstance(value, Sequence)
+                else value.href
+            )
+        else:
+            self.hrefs[rel] = (
+                *(current if isinstance(current, tuple) else (current,)),
+                *(link.href for link in rel_links),
+            )
@@ -1,23 +1,62 @@
-from urllib import parse as urllib
-
-from typing import TypedDict, NotRequired
-from dataclasses import dataclass
-from collections.abc import Mapping
+import time
 
-from httpx import Client, Response
+from urllib import parse as urllib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from functools import lru_cache
+from threading import Lock
+
+from typing import Literal, TypedDict, NotRequired, overload
+from dataclasses import dataclass, field
+from collections.abc import (
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+
+from httpx import URL, AsyncClient, Client, Headers, Request, Response
 from uritemplate import URITemplate
 
-from .types import Href, LinkRel, StatusCode, JsonValue
+from .types import Href, LinkRel, ResourceRel, StatusCode, JsonValue
+from .cache import CacheLookup, DiscoveryCache, DiscoveryLookup, ResponseCache
+from .codec import STDLIB_CODEC, JsonCodec, default_codec
 from .resource import Resource
+from .retry import RetryPolicy
+from .streaming import EmbeddedStreamParser
+from .tracing import (
+    AfterRequestHook,
+    BeforeRequestHook,
+    Span,
+    Timings,
+    Tracer,
+    end_request_span,
+    start_request_span,
+)
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_PREFETCH = 1
+JSON_HEADERS = {"content-type": "application/json"}
+TEMPLATE_CACHE_SIZE = 512
 
 
 class HttpSettingsDict(TypedDict):
     headers: NotRequired[dict[str, str]]
 
 
-class SettingsDict(TypedDict):
+class BaseSettingsDict[C: (Client, AsyncClient)](TypedDict):
     http: NotRequired[HttpSettingsDict]
-    client: NotRequired[Client]
+    client: NotRequired[C]
+    cache: NotRequired[ResponseCache | None]
+    discovery_cache: NotRequired[DiscoveryCache | None]
+    codec: NotRequired[JsonCodec]
+    before_request: NotRequired[list[BeforeRequestHook]]
+    after_request: NotRequired[list[AfterRequestHook]]
+    tracer: NotRequired[Tracer | None]
+    retry: NotRequired[RetryPolicy | None]
+    prefer_embedded: NotRequired[bool]
 
 
 @dataclass
@@ -26,52 +65,127 @@ class HttpSettings(object):
 
 
 @dataclass
-class Settings(object):
+class BaseSettings[C: (Client, AsyncClient)]:
     http: HttpSettings
-    client: Client
+    client: C
+    cache: ResponseCache | None = None
+    discovery_cache: DiscoveryCache | None = None
+    codec: JsonCodec = field(default_factory=default_codec)
+    before_request: list[BeforeRequestHook] = field(
+        default_factory=list[BeforeRequestHook]
+    )
+    after_request: list[AfterRequestHook] = field(
+        default_factory=list[AfterRequestHook]
+    )
+    tracer: Tracer | None = None
+    retry: RetryPolicy | None = None
+    prefer_embedded: bool = False
+
+    def request_headers(self) -> dict[str, str]:
+        headers = Headers(self.client.headers)
+        headers.update(self.http.headers)
+        return dict(headers)
+
+
+SettingsDict = BaseSettingsDict[Client]
+Settings = BaseSettings[Client]
+
+
+@dataclass
+class TemplateCacheInfo(object):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_template(href_template: Href) -> URITemplate:
+    return URITemplate(href_template)
+
+
+def template_cache_info() -> TemplateCacheInfo:
+    info = _compile_template.cache_info()
+    return TemplateCacheInfo(
+        hits=info.hits,
+        misses=info.misses,
+        size=info.currsize,
+        max_size=TEMPLATE_CACHE_SIZE,
+    )
+
+
+def clear_template_cache() -> None:
+    _compile_template.cache_clear()
+
+
+def discovery_headers[C: (Client, AsyncClient)](
+    settings: BaseSettingsDict[C],
+) -> dict[str, str]:
+    client = settings.get("client")
+    headers = Headers(client.headers if client is not None else None)
+    headers.update(settings.get("http", {}).get("headers", {}))
+    return dict(headers)
 
 
 def _resolve_link(
     href_template: Href, params: Mapping[str, str] | None = None
 ) -> tuple[str, Mapping[str, str]]:
     resolved_params: Mapping[str, str] = params if params is not None else {}
-    template = URITemplate(href_template)
-    # variables = template.variables
-    # variables = template.parts.reduce((accumulator, part) => {
-    # if not r.is_empty(part.variables):
-    #     return r.concat(
-    #         part.variables.map(variable => variable.name), accumulator
-    #     )
-    #
-    # return accumulator
-    # }, [])
+    if "{" not in href_template:
+        return href_template, resolved_params
+
+    template = _compile_template(href_template)
     href = template.expand(var_dict=None, **resolved_params)
-    # query_object = uri.URI(url)
-    full_params = resolved_params
-    # full_params = r.merge(r.omit(variables, params), query_object)
-    # url_without_query_string = URI(url).query('').toString()
+    full_params = {
+        name: value
+        for name, value in resolved_params.items()
+        if name not in template.variable_names
+    }
 
     return href, full_params
 
 
-def _make_absolute(base: str, href: Href) -> Href:
+def make_absolute(base: str, href: Href) -> Href:
     return urllib.urljoin(base, href)
 
 
-def _default_settings() -> Settings:
+def url_with_params(url: Href, params: Mapping[str, str] | None) -> URL:
+    return URL(url).copy_merge_params(params or {})
+
+
+@dataclass(frozen=True)
+class PostResult(object):
+    status: StatusCode
+    location: Href | None
+
+    @staticmethod
+    def from_response(response: Response) -> "PostResult":
+        location = response.headers.get("location")
+
+        return PostResult(
+            status=response.status_code,
+            location=(
+                make_absolute(str(response.url), location)
+                if location is not None
+                else None
+            ),
+        )
+
+
+def _default_settings(client: Client | None = None) -> Settings:
     return Settings(
         http=HttpSettings(headers={}),
-        client=Client(),
+        client=client if client is not None else Client(),
     )
 
 
-def _resolve_settings(
-    settings: Settings, overrides: SettingsDict | None = None
-) -> Settings:
+def resolve_settings[C: (Client, AsyncClient)](
+    settings: BaseSettings[C], overrides: BaseSettingsDict[C] | None = None
+) -> BaseSettings[C]:
     if overrides is None:
         return settings
 
-    return Settings(
+    return BaseSettings(
         http=HttpSettings(
             headers={
                 **settings.http.headers,
@@ -79,16 +193,149 @@ def _resolve_settings(
             },
         ),
         client=overrides.get("client", settings.client),
+        cache=overrides.get("cache", settings.cache),
+        discovery_cache=overrides.get(
+            "discovery_cache", settings.discovery_cache
+        ),
+        codec=overrides.get("codec", settings.codec),
+        before_request=overrides.get(
+            "before_request", settings.before_request
+        ),
+        after_request=overrides.get("after_request", settings.after_request),
+        tracer=overrides.get("tracer", settings.tracer),
+        retry=overrides.get("retry", settings.retry),
+        prefer_embedded=overrides.get(
+            "prefer_embedded", settings.prefer_embedded
+        ),
+    )
+
+
+class Exchange(object):
+    request: Request
+    _settings: BaseSettings[Client] | BaseSettings[AsyncClient]
+    _timings: Timings
+    _attempt: int
+    _span: Span | None
+    _started: float
+    _pending: bool
+
+    def __init__(
+        self,
+        request: Request,
+        settings: BaseSettings[Client] | BaseSettings[AsyncClient],
+        timings: Timings,
+    ):
+        self.request = request
+        self._settings = settings
+        self._timings = timings
+        self._attempt = 0
+        self._span = None
+        self._started = 0.0
+        self._pending = False
+
+    def start(self) -> None:
+        self._attempt += 1
+        self._span = None
+        if self._settings.retry is not None:
+            self._settings.retry.check(self.request)
+            self._pending = True
+
+        try:
+            for hook in self._settings.before_request:
+                hook(self.request)
+        except BaseException:
+            self.finish()
+            raise
+
+        self._span = start_request_span(self._settings.tracer, self.request)
+        self._started = time.perf_counter()
+
+    def finish(self) -> None:
+        retry = self._settings.retry
+        if self._pending and retry is not None:
+            retry.release(self.request)
+        self._pending = False
+
+    def failed(self, error: Exception) -> float | None:
+        end_request_span(self._span, error=error)
+
+        retry = self._settings.retry
+        if retry is None:
+            return None
+
+        self._pending = False
+        return retry.delay_after_error(self.request, error, self._attempt)
+
+    def completed(self, response: Response) -> float | None:
+        elapsed = time.perf_counter() - self._started
+        self._timings.network += elapsed
+        end_request_span(self._span, response=response)
+
+        for hook in self._settings.after_request:
+            hook(self.request, response, elapsed)
+
+        retry = self._settings.retry
+        if retry is None:
+            return None
+
+        self._pending = False
+        return retry.delay_after_response(
+            self.request, response, self._attempt
+        )
+
+
+def _send(
+    *,
+    method: str,
+    url: URL,
+    content: bytes | None = None,
+    headers: Mapping[str, str] | None = None,
+    settings: Settings,
+    timings: Timings,
+    stream: bool = False,
+) -> Response:
+    exchange = Exchange(
+        settings.client.build_request(
+            method, url, content=content, headers=headers
+        ),
+        settings,
+        timings,
     )
 
+    while True:
+        exchange.start()
+        try:
+            response = settings.client.send(exchange.request, stream=stream)
+        except Exception as e:
+            delay = exchange.failed(e)
+            if delay is None:
+                raise
+        else:
+            delay = exchange.completed(response)
+            if delay is None:
+                return response
+            response.close()
+        finally:
+            exchange.finish()
+
+        time.sleep(delay)
+
 
 def _get_url(
     *,
     url: Href,
     params: Mapping[str, str] | None = None,
+    headers: Mapping[str, str] | None = None,
     settings: Settings,
+    timings: Timings,
 ) -> Response:
-    return settings.client.get(url, params=params)
+    return _send(
+        method="GET",
+        url=url_with_params(url, params),
+        headers=headers,
+        settings=settings,
+        timings=timings,
+    )
 
 
 def _post_url(
@@ -97,53 +344,112 @@ def _post_url(
     body: JsonValue,
     params: Mapping[str, str] | None = None,
     settings: Settings,
+    timings: Timings,
 ):
-    return settings.client.post(url, json=body, params=params)
+    return _send(
+        method="POST",
+        url=url_with_params(url, params),
+        content=settings.codec.dumps(body),
+        headers=JSON_HEADERS,
+        settings=settings,
+        timings=timings,
+    )
 
 
-class Navigator:
-    _settings: Settings
-    _status_code: StatusCode
+class BaseNavigator:
+    _status_code: StatusCode | None
     _location: Href
-    _resource: Resource
-    _response: Response
+    _resource: Resource | None
+    _response: Response | None
+    _codec: JsonCodec
+    _timings: Timings
+    _lock: Lock
+    _embedded_index: dict[ResourceRel, dict[Href, Resource]]
 
     def __init__(
         self,
-        settings: Settings,
-        response: Response,
+        response: Response | None,
+        resource: Resource | None = None,
+        codec: JsonCodec = STDLIB_CODEC,
+        timings: Timings | None = None,
+        location: Href = "",
     ):
-        self._settings = settings
+        if response is None and resource is None:
+            raise ValueError("A navigator without a response needs a resource")
+
         self._response = response
-        self._status_code = response.status_code
-        self._location = str(response.url)
-        self._resource = Resource.from_object(response.json())
+        self._status_code = (
+            response.status_code if response is not None else None
+        )
+        self._location = (
+            str(response.url) if response is not None else location
+        )
+        self._resource = resource
+        self._codec = codec
+        self._timings = timings if timings is not None else Timings()
+        self._lock = Lock()
+        self._embedded_index = {}
 
-    @staticmethod
-    def discover(url: Href, settings: SettingsDict = {}):
-        resolved_settings = _resolve_settings(_default_settings(), settings)
+    def resource(self) -> Resource:
+        if self._resource is not None:
+            return self._resource
 
-        response = _get_url(url=url, params={}, settings=resolved_settings)
+        with self._lock:
+            if self._resource is None:
+                self._resource = self._parse()
 
-        return Navigator(settings=resolved_settings, response=response)
+            return self._resource
 
-    def resource(self) -> Resource:
-        return self._resource
+    def _parse(self) -> Resource:
+        if self._response is None or not self._response.content:
+            return Resource()
+
+        started = time.perf_counter()
+        document = self._codec.loads(self._response.content)
+        decoded = time.perf_counter()
+        resource = Resource.from_object(document, lazy=True)
+        self._timings.decode += decoded - started
+        self._timings.resource_build += time.perf_counter() - decoded
+
+        return resource
+
+    def _embedded_items(self, rel: ResourceRel) -> list[Resource]:
+        resource = self.resource()
+
+        if not resource.has_resource(rel):
+            return []
+
+        items = resource.get_resource(rel)
+        return list(items) if isinstance(items, Sequence) else [items]
 
     def status(self):
         return self._status_code
 
+    def is_synthetic(self) -> bool:
+        return self._response is None
+
+    def location(self) -> Href:
+        return self._location
+
     def get_header(self, header: str):
+        if self._response is None:
+            raise KeyError(header)
+
         return self._response.headers[header]
 
+    def timings(self) -> Timings:
+        return self._timings
+
     def _resolve_link(
         self,
         *,
         rel: LinkRel,
         index: int = 0,
         params: Mapping[str, str] | None = None,
+        timings: Timings | None = None,
     ) -> tuple[str, Mapping[str, str]]:
-        href = self._resource.get_href(rel)
+        started = time.perf_counter()
+        href = self.resource().get_href(rel)
 
         if not isinstance(href, Href):
             href = href[index]
@@ -154,20 +460,285 @@ class Navigator:
         #     )
 
         href, resolved_params = _resolve_link(href, params)
+        href = make_absolute(self._location, href)
+
+        if timings is not None:
+            timings.template_resolution += time.perf_counter() - started
+
+        return href, resolved_params
+
+    def _find_embedded(
+        self, rel: LinkRel, href: Href, params: Mapping[str, str]
+    ) -> Resource | None:
+        if params:
+            return None
+
+        return self._embedded_by_href(rel).get(href)
+
+    def _embedded_by_href(self, rel: ResourceRel) -> Mapping[Href, Resource]:
+        index = self._embedded_index.get(rel)
+        if index is not None:
+            return index
+
+        items = self._embedded_items(rel)
+        with self._lock:
+            index = self._embedded_index.get(rel)
+            if index is not None:
+                return index
+
+            built: dict[Href, Resource] = {}
+            for item in items:
+                if not item.has_link("self"):
+                    continue
+
+                self_href = item.get_href("self")
+                if isinstance(self_href, Href):
+                    built.setdefault(
+                        make_absolute(self._location, self_href), item
+                    )
 
-        return _make_absolute(self._location, href), resolved_params
+            self._embedded_index[rel] = built
+            return built
+
+    def _resolve_links(
+        self,
+        *,
+        rel: LinkRel,
+        params: Mapping[str, str] | None = None,
+    ) -> list[tuple[str, Mapping[str, str]]]:
+        href = self.resource().get_href(rel)
+        count = 1 if isinstance(href, Href) else len(href)
+
+        return [
+            self._resolve_link(rel=rel, index=index, params=params)
+            for index in range(count)
+        ]
+
+
+def _get_navigator(
+    *,
+    url: Href,
+    params: Mapping[str, str] | None = None,
+    settings: Settings,
+    timings: Timings | None = None,
+) -> "Navigator":
+    timings = timings if timings is not None else Timings()
+    lookup = CacheLookup(settings.cache, url, params)
+
+    entry = lookup.fresh_entry()
+    if entry is None:
+        response = _get_url(
+            url=url,
+            params=params,
+            headers=lookup.conditional_headers(),
+            settings=settings,
+            timings=timings,
+        )
+        entry = lookup.revalidated(response)
+
+        if entry is None:
+            navigator = Navigator(
+                settings=settings, response=response, timings=timings
+            )
+            lookup.store(response, navigator.resource)
+            return navigator
+
+    return Navigator(
+        settings=settings,
+        response=entry.to_response(),
+        resource=entry.resource,
+        timings=timings,
+    )
+
+
+class Navigator(BaseNavigator):
+    _settings: Settings
+
+    def __init__(
+        self,
+        settings: Settings,
+        response: Response | None,
+        resource: Resource | None = None,
+        timings: Timings | None = None,
+        location: Href = "",
+    ):
+        super().__init__(response, resource, settings.codec, timings, location)
+        self._settings = settings
+
+    def request_headers(self) -> dict[str, str]:
+        return self._settings.request_headers()
+
+    def _embedded_navigator(
+        self,
+        rel: LinkRel,
+        href: Href,
+        params: Mapping[str, str],
+        timings: Timings | None = None,
+    ) -> "Navigator | None":
+        if not self._settings.prefer_embedded:
+            return None
+
+        resource = self._find_embedded(rel, href, params)
+        if resource is None:
+            return None
+
+        return Navigator(
+            settings=self._settings,
+            response=None,
+            resource=resource,
+            timings=timings,
+            location=href,
+        )
+
+    @staticmethod
+    def discover(url: Href, settings: SettingsDict = {}):
+        client = settings.get("client")
+        lookup = DiscoveryLookup(
+            settings.get("discovery_cache"), url, discovery_headers(settings)
+        )
+
+        entry = lookup.entry()
+        if entry is not None:
+            if client is None and isinstance(entry.client, Client):
+                client = entry.client
+            return Navigator(
+                settings=resolve_settings(_default_settings(client), settings),
+                response=entry.response,
+                resource=entry.resource,
+            )
+
+        resolved_settings = resolve_settings(
+            _default_settings(client), settings
+        )
+        navigator = _get_navigator(
+            url=url, params={}, settings=resolved_settings
+        )
+        if navigator._response is not None:
+            lookup.store(
+                navigator._response,
+                navigator.resource,
+                resolved_settings.client,
+            )
+
+        return navigator
 
     def get(
         self, rel: LinkRel, params: Mapping[str, str] | None = None
     ) -> "Navigator":
+        timings = Timings()
+        href, resolved_params = self._resolve_link(
+            rel=rel, params=params, timings=timings
+        )
+
+        embedded = self._embedded_navigator(
+            rel, href, resolved_params, timings
+        )
+        if embedded is not None:
+            return embedded
+
+        return _get_navigator(
+            url=href,
+            params=resolved_params,
+            settings=self._settings,
+            timings=timings,
+        )
+
+    def follow(self, href: Href) -> "Navigator":
+        return _get_navigator(
+            url=make_absolute(self._location, href), settings=self._settings
+        )
+
+    def get_all(
+        self,
+        rel: LinkRel,
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list["Navigator | Exception"]:
+        def follow(link: tuple[str, Mapping[str, str]]):
+            href, resolved_params = link
+            embedded = self._embedded_navigator(rel, href, resolved_params)
+            if embedded is not None:
+                return embedded
+
+            try:
+                return _get_navigator(
+                    url=href, params=resolved_params, settings=self._settings
+                )
+            except Exception as e:
+                return e
+
+        links = self._resolve_links(rel=rel, params=params)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(follow, links))
+
+    def iter_pages(
+        self, next_rel: LinkRel = "next", prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator["Navigator"]:
+        def fetch_next(
+            previous: Future["Navigator | None"],
+        ) -> "Navigator | None":
+            page = previous.result()
+            if page is None or not page.resource().has_link(next_rel):
+                return None
+            return page.get(next_rel)
+
+        tail: Future[Navigator | None] = Future()
+        tail.set_result(self)
+        pending = deque([tail])
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            while True:
+                while len(pending) <= prefetch:
+                    tail = executor.submit(fetch_next, tail)
+                    pending.append(tail)
+
+                page = pending.popleft().result()
+                if page is None:
+                    return
+
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_items(
+        self,
+        embedded_rel: ResourceRel,
+        next_rel: LinkRel = "next",
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator[Resource]:
+        for page in self.iter_pages(next_rel=next_rel, prefetch=prefetch):
+            yield from page._embedded_items(embedded_rel)
+
+    def stream_embedded(
+        self,
+        rel: LinkRel,
+        embedded_rel: ResourceRel | None = None,
+        params: Mapping[str, str] | None = None,
+    ) -> Iterator[Resource]:
         href, resolved_params = self._resolve_link(rel=rel, params=params)
+        parser = EmbeddedStreamParser(
+            embedded_rel if embedded_rel is not None else rel,
+            self._settings.codec,
+        )
 
-        return Navigator(
+        response = _send(
+            method="GET",
+            url=url_with_params(href, resolved_params),
             settings=self._settings,
-            response=_get_url(
-                url=href, params=resolved_params, settings=self._settings
-            ),
+            timings=Timings(),
+            stream=True,
         )
+        try:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                for item in parser.feed(chunk):
+                    yield Resource.from_object(item, lazy=True)
+        finally:
+            response.close()
 
     def post(
         self,
@@ -175,7 +746,10 @@ class Navigator:
         body: JsonValue,
         params: Mapping[str, str] | None = None,
     ):
-        href, resolved_params = self._resolve_link(rel=rel, params=params)
+        timings = Timings()
+        href, resolved_params = self._resolve_link(
+            rel=rel, params=params, timings=timings
+        )
 
         return Navigator(
             settings=self._settings,
@@ -184,5 +758,79 @@ class Navigator:
                 body=body,
                 params=resolved_params,
                 settings=self._settings,
+                timings=timings,
             ),
+            timings=timings,
         )
+
+    @overload
+    def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: Literal[True] = True,
+    ) -> list["Navigator | Exception"]: ...
+
+    @overload
+    def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: Literal[False],
+    ) -> list[PostResult | Exception]: ...
+
+    def post_many(
+        self,
+        rel: LinkRel,
+        bodies: Iterable[JsonValue],
+        params: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        *,
+        parse: bool = True,
+    ) -> Sequence["Navigator | PostResult | Exception"]:
+        href, resolved_params = self._resolve_link(rel=rel, params=params)
+
+        def send(body: JsonValue) -> "Navigator | PostResult | Exception":
+            timings = Timings()
+            try:
+                response = _post_url(
+                    url=href,
+                    body=body,
+                    params=resolved_params,
+                    settings=self._settings,
+                    timings=timings,
+                )
+                if not parse:
+                    return PostResult.from_response(response)
+
+                return Navigator(
+                    settings=self._settings,
+                    response=response,
+                    timings=timings,
+                )
+            except Exception as e:
+                return e
+
+        results: dict[int, Navigator | PostResult | Exception] = {}
+        pending: dict[Future[Navigator | PostResult | Exception], int] = {}
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for index, body in enumerate(bodies):
+                pending[executor.submit(send, body)] = index
+                if len(pending) >= max_concurrency:
+                    done, _ = wait_futures(
+                        pending, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+
+            for future, index in pending.items():
+                results[index] = future.result()
+
+        return [results[index] for index in range(len(results))]
@@ -0,0 +1,228 @@
+import asyncio
+import time
+
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+
+from .async_navigator import AsyncNavigator
+from .navigator import DEFAULT_MAX_CONCURRENCY, BaseNavigator, Navigator
+from .types import Href, LinkRel
+
+type HopKey = tuple[tuple[LinkRel, tuple[tuple[str, str], ...]], ...]
+type PlanScope = tuple[Href, tuple[tuple[str, str], ...]]
+
+DEFAULT_SHARED_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class PlanStep(object):
+    rel: LinkRel
+    params: Mapping[str, str] = field(default_factory=dict[str, str])
+    variables: Sequence[str] = ()
+
+    def resolve(self, parameters: Mapping[str, str]) -> dict[str, str]:
+        return {
+            **self.params,
+            **{variable: parameters[variable] for variable in self.variables},
+        }
+
+
+class BaseNavigationPlan[N: BaseNavigator]:
+    _steps: tuple[PlanStep, ...]
+    _shared_depth: int
+    _shared: dict[tuple[PlanScope, HopKey], tuple[N, float]]
+    _ttl: float
+
+    def __init__(
+        self,
+        steps: Iterable[LinkRel | PlanStep],
+        ttl: float = DEFAULT_SHARED_TTL,
+    ):
+        self._steps = tuple(
+            step if isinstance(step, PlanStep) else PlanStep(step)
+            for step in steps
+        )
+        self._shared_depth = next(
+            (
+                depth
+                for depth, step in enumerate(self._steps)
+                if step.variables
+            ),
+            len(self._steps),
+        )
+        self._shared = {}
+        self._ttl = ttl
+        self._lock = Lock()
+
+    def steps(self) -> tuple[PlanStep, ...]:
+        return self._steps
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._shared.clear()
+
+    def _scope(self, start: N, headers: Mapping[str, str]) -> PlanScope:
+        return start.location(), tuple(sorted(headers.items()))
+
+    def _lookup_shared(
+        self, scope: PlanScope, depth: int, key: HopKey
+    ) -> N | None:
+        if depth >= self._shared_depth:
+            return None
+
+        with self._lock:
+            entry = self._shared.get((scope, key))
+            if entry is None:
+                return None
+
+            hop, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._shared[(scope, key)]
+                return None
+
+            return hop
+
+    def _store_shared(self, scope: PlanScope, depth: int, key: HopKey, hop: N):
+        status = hop.status()
+        if depth >= self._shared_depth or (
+            status is not None and not 200 <= status < 300
+        ):
+            return
+
+        now = time.monotonic()
+
+        with self._lock:
+            for expired in [
+                shared
+                for shared, (_, expires_at) in self._shared.items()
+                if expires_at <= now
+            ]:
+                del self._shared[expired]
+            self._shared[(scope, key)] = (hop, now + self._ttl)
+
+    def _plan_hops(
+        self,
+        step: PlanStep,
+        results: list[N | Exception],
+        keys: list[HopKey],
+        parameter_sets: Sequence[Mapping[str, str]],
+    ) -> dict[HopKey, tuple[N, dict[str, str]]]:
+        hops: dict[HopKey, tuple[N, dict[str, str]]] = {}
+
+        for index, parameters in enumerate(parameter_sets):
+            current = results[index]
+            if isinstance(current, Exception):
+                continue
+
+            try:
+                params = step.resolve(parameters)
+            except KeyError as e:
+                results[index] = e
+                continue
+
+            keys[index] += ((step.rel, tuple(sorted(params.items()))),)
+            hops.setdefault(keys[index], (current, params))
+
+        return hops
+
+    def _apply_hops(
+        self,
+        results: list[N | Exception],
+        keys: list[HopKey],
+        fetched: Mapping[HopKey, N | Exception],
+    ):
+        for index, current in enumerate(results):
+            if not isinstance(current, Exception):
+                results[index] = fetched[keys[index]]
+
+
+class NavigationPlan(BaseNavigationPlan[Navigator]):
+    def execute(
+        self,
+        navigator: Navigator,
+        parameter_sets: Sequence[Mapping[str, str]] = ({},),
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Navigator | Exception]:
+        results: list[Navigator | Exception] = [navigator] * len(
+            parameter_sets
+        )
+        keys: list[HopKey] = [()] * len(parameter_sets)
+        scope = self._scope(navigator, navigator.request_headers())
+
+        def follow(
+            depth: int, key: HopKey, parent: Navigator, params: dict[str, str]
+        ) -> Navigator | Exception:
+            shared = self._lookup_shared(scope, depth, key)
+            if shared is not None:
+                return shared
+
+            try:
+                hop = parent.get(self._steps[depth].rel, params)
+            except Exception as e:
+                return e
+
+            self._store_shared(scope, depth, key, hop)
+            return hop
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for depth, step in enumerate(self._steps):
+                hops = self._plan_hops(step, results, keys, parameter_sets)
+                futures = {
+                    key: executor.submit(follow, depth, key, parent, params)
+                    for key, (parent, params) in hops.items()
+                }
+                self._apply_hops(
+                    results,
+                    keys,
+                    {key: future.result() for key, future in futures.items()},
+                )
+
+        return results
+
+
+class AsyncNavigationPlan(BaseNavigationPlan[AsyncNavigator]):
+    async def execute(
+        self,
+        navigator: AsyncNavigator,
+        parameter_sets: Sequence[Mapping[str, str]] = ({},),
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AsyncNavigator | Exception]:
+        results: list[AsyncNavigator | Exception] = [navigator] * len(
+            parameter_sets
+        )
+        keys: list[HopKey] = [()] * len(parameter_sets)
+        scope = self._scope(navigator, navigator.request_headers())
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def follow(
+            depth: int,
+            key: HopKey,
+            parent: AsyncNavigator,
+            params: dict[str, str],
+        ) -> AsyncNavigator | Exception:
+            shared = self._lookup_shared(scope, depth, key)
+            if shared is not None:
+                return shared
+
+            async with semaphore:
+                try:
+                    hop = await parent.get(self._steps[depth].rel, params)
+                except Exception as e:
+                    return e
+
+            self._store_shared(scope, depth, key, hop)
+            return hop
+
+        for depth, step in enumerate(self._steps):
+            hops = self._plan_hops(step, results, keys, parameter_sets)
+            fetched = await asyncio.gather(
+                *(
+                    follow(depth, key, parent, params)
+                    for key, (parent, params) in hops.items()
+                )
+            )
+            self._apply_hops(results, keys, dict(zip(hops, fetched)))
+
+        return results
@@ -1,13 +1,23 @@
+import json
+
+from sys import intern
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Literal,
     NotRequired,
+    Protocol,
     Self,
     TypedDict,
     cast,
+    overload,
 )
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 
+from .codec import JsonCodec, default_codec
+from .columns import Column, ColumnFormat, ColumnSource, build_columns
+from .link import Link, LinkDict, LinkIndex
 from .types import (
     Href,
     LinkRel,
@@ -18,12 +28,6 @@ from .types import (
 )
 
 
-class LinkDict(TypedDict):
-    href: Href
-    title: NotRequired[str]
-    templated: NotRequired[bool]
-
-
 # This requires https://peps.python.org/pep-0728
 # class ResourceDict(TypedDict, extra_items=JSONNode):
 #     _links: Mapping[LinkRel, LinkDict | Sequence[LinkDict]]
@@ -43,21 +47,21 @@ class LinksPropertyDict(TypedDict):
 
 
 def dict_to_resource(resource_dict: ResourceDict) -> "Resource":
-    _links = resource_dict.get("_links", {})
-    _embedded = resource_dict.get("_embedded", {})
+    _links = resource_dict.get("_links")
+    _embedded = resource_dict.get("_embedded")
     _properties = {
-        prop: resource_dict[prop]
-        for prop in resource_dict.keys()
-        if prop not in ["_links", "_embedded"]
+        prop: value
+        for prop, value in resource_dict.items()
+        if prop != "_links" and prop != "_embedded"
     }
 
-    return (
-        Resource()
-        .add_links(_links)
-        .add_properties(_properties)
-        .add_resources(dict_to_embedded(_embedded))
+    resource = Resource(
+        _properties,
+        embedded=dict_to_embedded(_embedded) if _embedded else {},
     )
 
+    return resource.add_links(_links) if _links else resource
+
 
 def dicts_to_resources(
     resource_dicts: ResourceDict | Sequence[ResourceDict],
@@ -80,8 +84,59 @@ def dict_to_embedded(
     }
 
 
+def to_link(value: LinkDict | Href | Link) -> Link:
+    if isinstance(value, dict):
+        return Link.from_dict(value)
+    if isinstance(value, Href):
+        return Link(value)
+    return value
+
+
+def trusted_link_dict(value: LinkDict | Href) -> LinkDict:
+    return {"href": value} if isinstance(value, str) else value
+
+
+def trusted_link_dicts(
+    links: Mapping[LinkRel, LinkDict | Href | list[LinkDict | Href]],
+) -> dict[LinkRel, LinkDict | Sequence[LinkDict]]:
+    result: dict[LinkRel, LinkDict | Sequence[LinkDict]] = {}
+
+    for rel, value in links.items():
+        if not isinstance(value, list):
+            result[intern(rel)] = trusted_link_dict(value)
+        elif len(value) == 1:
+            result[intern(rel)] = trusted_link_dict(value[0])
+        elif value:
+            result[intern(rel)] = [trusted_link_dict(link) for link in value]
+
+    return result
+
+
+def to_links(
+    links: Mapping[LinkRel, LinkDict | Sequence[LinkDict]],
+) -> dict[LinkRel, Link | Sequence[Link]]:
+    return {
+        intern(rel): (
+            [to_link(link) for link in value]
+            if isinstance(value, Sequence)
+            else to_link(value)
+        )
+        for rel, value in links.items()
+    }
+
+
+def links_to_dicts(
+    links: Link | Sequence[Link],
+) -> LinkDict | Sequence[LinkDict]:
+    if isinstance(links, tuple):
+        return tuple(link.to_dict() for link in links)
+    if isinstance(links, Sequence):
+        return [link.to_dict() for link in links]
+    return links.to_dict()
+
+
 def links_to_object(
-    links: dict[LinkRel, LinkDict | Sequence[LinkDict]],
+    links: Mapping[LinkRel, LinkDict | Sequence[LinkDict]],
 ) -> LinksPropertyDict:
     if len(links) == 0:
         return {}
@@ -97,7 +152,7 @@ def resources_to_object(
 
 
 def embedded_to_object(
-    embeds: dict[ResourceRel, "Resource | Sequence[Resource]"],
+    embeds: Mapping[ResourceRel, "Resource | Sequence[Resource]"],
 ) -> EmbeddedPropertyDict:
     if len(embeds) == 0:
         return {}
@@ -109,27 +164,105 @@ def embedded_to_object(
     }
 
 
-def create_or_append[R: (LinkRel, ResourceRel), T: (LinkDict, "Resource")](
+class SupportsWrite(Protocol):
+    def write(self, s: str, /) -> object: ...
+
+
+def links_to_json(links: Link | Sequence[Link]) -> str:
+    if isinstance(links, Sequence):
+        return "[" + ", ".join(link.to_json() for link in links) + "]"
+    return links.to_json()
+
+
+def iter_resources_json(
+    resources: "Resource | Sequence[Resource]",
+) -> Iterator[str]:
+    if not isinstance(resources, Sequence):
+        yield from resources.iter_json()
+        return
+
+    yield "["
+    for index, resource in enumerate(resources):
+        if index > 0:
+            yield ", "
+        yield from resource.iter_json()
+    yield "]"
+
+
+def create_or_append[
+    R: (LinkRel, ResourceRel),
+    T: (Link, LinkDict, "Resource"),
+](
     links: dict[R, T | Sequence[T]], rel: R, value: T | Sequence[T]
 ) -> dict[R, T | Sequence[T]]:
     if rel not in links:
-        links[rel] = value
+        links[cast(R, intern(rel))] = (
+            list(value) if isinstance(value, Sequence) else value
+        )
         return links
 
     link = links[rel]
 
-    if isinstance(link, Sequence) and isinstance(value, Sequence):
-        links[rel] = [*link, *value]
-    elif isinstance(link, Sequence):
-        links[rel] = [*link, cast(T, value)]
+    if not isinstance(link, list):
+        link = links[rel] = (
+            list(link) if isinstance(link, Sequence) else [link]
+        )
+
+    if isinstance(value, Sequence):
+        link.extend(value)
     else:
-        links[rel] = [cast(T, link), cast(T, value)]
+        link.append(value)
 
     return links
 
 
+def freeze_links(links: Link | Sequence[Link]) -> Link | tuple[Link, ...]:
+    return tuple(links) if isinstance(links, Sequence) else links
+
+
+def freeze_resources(
+    resources: "Resource | Sequence[Resource]",
+) -> "Resource | tuple[Resource, ...]":
+    if isinstance(resources, Sequence):
+        return tuple(resource.freeze() for resource in resources)
+    return resources.freeze()
+
+
+def append_frozen[R: (LinkRel, ResourceRel), T: (Link, "Resource")](
+    values: dict[R, T | Sequence[T]], rel: R, value: T | tuple[T, ...]
+) -> None:
+    if rel not in values:
+        values[cast(R, intern(rel))] = value
+        return
+
+    current = values[rel]
+    values[rel] = (
+        *(current if isinstance(current, Sequence) else (current,)),
+        *(value if isinstance(value, tuple) else (value,)),
+    )
+
+
+def copy_resources(
+    values: Mapping[ResourceRel, "Resource | Sequence[Resource]"],
+) -> dict[ResourceRel, "Resource | Sequence[Resource]"]:
+    return {
+        intern(rel): list(value) if isinstance(value, Sequence) else value
+        for rel, value in values.items()
+    }
+
+
 class Resource(object):
-    _links: dict[LinkRel, LinkDict | Sequence[LinkDict]]
+    __slots__ = (
+        "_links",
+        "_embedded",
+        "_properties",
+        "_link_index",
+        "_link_dicts",
+    )
+
+    _links: dict[LinkRel, Link | Sequence[Link]]
+    _link_index: LinkIndex | None
+    _link_dicts: dict[LinkRel, LinkDict | Sequence[LinkDict]] | None
     _embedded: dict[ResourceRel, "Resource | Sequence[Resource]"]
     _properties: dict[PropertyName, PropertyValue]
 
@@ -140,53 +273,207 @@ class Resource(object):
         embedded: Mapping[PropertyName, Self | Sequence[Self]] = {},
     ) -> None:
         self._properties = dict(properties)
-        self._links = dict(links)
-        self._embedded = dict(embedded)
+        self._links = to_links(links) if links else {}
+        self._link_index = None
+        self._link_dicts = None
+        self._embedded = copy_resources(embedded) if embedded else {}
 
     @staticmethod
-    def from_object(resource_dict: ResourceDict):
+    def from_object(
+        resource_dict: ResourceDict, lazy: bool = False, trusted: bool = False
+    ) -> "Resource":
+        if lazy:
+            return LazyResource(resource_dict)
+        if trusted:
+            return Resource._from_trusted_object(resource_dict)
         return dict_to_resource(resource_dict)
 
+    @staticmethod
+    def _from_trusted_object(resource_dict: ResourceDict) -> "Resource":
+        properties = dict(resource_dict)
+        links: (
+            Mapping[LinkRel, LinkDict | Href | list[LinkDict | Href]] | None
+        ) = properties.pop("_links", None)
+        embedded: (
+            Mapping[ResourceRel, ResourceDict | list[ResourceDict]] | None
+        ) = properties.pop("_embedded", None)
+
+        resource = object.__new__(TrustedResource)
+        resource._properties = properties
+        resource._link_index = None
+        resource._link_dicts = trusted_link_dicts(links) if links else {}
+        resource._embedded = (
+            {
+                intern(rel): (
+                    [
+                        TrustedResource._from_trusted_object(item)
+                        for item in value
+                    ]
+                    if isinstance(value, list)
+                    else TrustedResource._from_trusted_object(value)
+                )
+                for rel, value in embedded.items()
+            }
+            if embedded
+            else {}
+        )
+
+        return resource
+
+    @staticmethod
+    def from_json(
+        data: bytes | str,
+        codec: JsonCodec | None = None,
+        lazy: bool = False,
+        trusted: bool = False,
+    ) -> "Resource":
+        resolved_codec = codec if codec is not None else default_codec()
+        return Resource.from_object(
+            resolved_codec.loads(data), lazy=lazy, trusted=trusted
+        )
+
+    def _index(self) -> LinkIndex:
+        if self._link_index is None:
+            self._link_index = LinkIndex(self._links)
+
+        return self._link_index
+
+    def _link_dicts_for(self, rel: LinkRel) -> LinkDict | Sequence[LinkDict]:
+        if self._link_dicts is None:
+            self._link_dicts = {}
+
+        link_dicts = self._link_dicts.get(rel)
+        if link_dicts is None:
+            link_dicts = self._link_dicts[rel] = links_to_dicts(
+                self._links[rel]
+            )
+
+        return link_dicts
+
+    def _is_materialised(self, name: str) -> bool:
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def _all_link_dicts(
+        self,
+    ) -> dict[LinkRel, LinkDict | Sequence[LinkDict]]:
+        cached = self._link_dicts
+        if cached is None or len(cached) < len(self._links):
+            previous = cached or {}
+            cached = self._link_dicts = {
+                rel: (
+                    previous[rel] if rel in previous else links_to_dicts(value)
+                )
+                for rel, value in self._links.items()
+            }
+
+        return cached
+
+    def _links_added(self, rel: LinkRel, value: Link | Sequence[Link]) -> None:
+        if self._link_index is not None:
+            self._link_index.add(rel, value)
+        if self._link_dicts is not None and rel in self._link_dicts:
+            create_or_append(self._link_dicts, rel, links_to_dicts(value))
+
+    def freeze(self) -> "FrozenResource":
+        frozen = object.__new__(FrozenResource)
+        frozen._links = {
+            rel: freeze_links(value) for rel, value in self._links.items()
+        }
+        frozen._link_index = None
+        frozen._link_dicts = None
+        frozen._embedded = {
+            rel: freeze_resources(value)
+            for rel, value in self._embedded.items()
+        }
+        frozen._properties = dict(self._properties)
+
+        return frozen
+
     def get_href(self, rel: LinkRel) -> Href | Sequence[Href]:
-        link_or_links = self._links[rel]
+        hrefs = self._index().hrefs[rel]
 
-        if isinstance(link_or_links, Sequence):
-            return [link["href"] for link in link_or_links]
+        if isinstance(hrefs, tuple):
+            return list(hrefs)
 
-        return link_or_links["href"]
+        return hrefs
 
-    def add_link(self, rel: LinkRel, value: LinkDict | Href) -> Self:
-        if isinstance(value, Href):
-            return self.add_link(rel, {"href": value})
+    def get_link_by_name(self, rel: LinkRel, name: str) -> LinkDict:
+        return self._index().names[(rel, name)].to_dict()
 
-        self._links = create_or_append(self._links, rel, value)
+    def get_link_by_title(self, rel: LinkRel, title: str) -> LinkDict:
+        return self._index().titles[(rel, title)].to_dict()
+
+    def get_rels(self, href: Href) -> Sequence[LinkRel]:
+        return list(self._index().rels.get(href, []))
+
+    def add_link(self, rel: LinkRel, value: LinkDict | Href | Link) -> Self:
+        link = to_link(value)
+        self._links = create_or_append(self._links, rel, link)
+        self._links_added(rel, link)
 
         return self
 
+    def has_link(self, rel: LinkRel) -> bool:
+        return rel in self._links
+
     def get_link(self, rel: LinkRel) -> LinkDict | Sequence[LinkDict]:
-        link_or_links = self._links[rel]
+        link_dicts = self._link_dicts_for(rel)
 
-        if isinstance(link_or_links, Sequence):
-            return list(link_or_links)
+        if isinstance(link_dicts, list):
+            return list(link_dicts)
 
-        return link_or_links
+        return link_dicts
 
     def get_hrefs(self) -> Mapping[LinkRel, Href | Sequence[Href]]:
-        return {rel: self.get_href(rel) for rel in self._links}
+        return {
+            rel: list(hrefs) if isinstance(hrefs, tuple) else hrefs
+            for rel, hrefs in self._index().hrefs.items()
+        }
 
     def get_links(self) -> Mapping[LinkRel, LinkDict | Sequence[LinkDict]]:
-        return dict(self._links)
+        return dict(self._all_link_dicts())
 
     def add_links(
         self,
-        links: Mapping[LinkRel, Href | LinkDict | Sequence[LinkDict]],
+        links: Mapping[
+            LinkRel, Href | LinkDict | Link | Sequence[LinkDict | Link]
+        ],
     ) -> Self:
         for rel, value in links.items():
-            if isinstance(value, Href) or isinstance(value, dict):
-                self.add_link(rel, value)
+            if rel in self._links:
+                if isinstance(value, (Href, dict, Link)):
+                    self.add_link(rel, value)
+                else:
+                    self.add_links_bulk(rel, value)
+            elif isinstance(value, (Href, dict, Link)):
+                link = self._links[intern(rel)] = to_link(value)
+                self._links_added(rel, link)
             else:
-                for link in value:
-                    self.add_link(rel, link)
+                values = [to_link(link) for link in value]
+                if len(values) > 1:
+                    self._links[intern(rel)] = values
+                    self._links_added(rel, values)
+                elif values:
+                    self._links[intern(rel)] = values[0]
+                    self._links_added(rel, values[0])
+
+        return self
+
+    def add_links_bulk(
+        self, rel: LinkRel, links: Iterable[LinkDict | Href | Link]
+    ) -> Self:
+        values = [to_link(link) for link in links]
+
+        if len(values) == 1 and rel not in self._links:
+            self._links[intern(rel)] = values[0]
+            self._links_added(rel, values[0])
+        elif len(values) > 0:
+            self._links = create_or_append(self._links, rel, values)
+            self._links_added(rel, values)
 
         return self
 
@@ -201,7 +488,13 @@ class Resource(object):
     def get_resources(
         self,
     ) -> Mapping[ResourceRel, "Resource | Sequence[Resource]"]:
-        return dict(self._embedded)
+        return {
+            rel: list(value) if isinstance(value, Sequence) else value
+            for rel, value in self._embedded.items()
+        }
+
+    def has_resource(self, rel: ResourceRel) -> bool:
+        return rel in self._embedded
 
     def get_resource(
         self, rel: ResourceRel
@@ -219,6 +512,52 @@ class Resource(object):
         self._embedded = create_or_append(self._embedded, rel, value)
         return self
 
+    def add_resources_bulk(
+        self, rel: ResourceRel, resources: Iterable[Self]
+    ) -> Self:
+        self._embedded = create_or_append(self._embedded, rel, list(resources))
+        return self
+
+    def _column_source(self) -> ColumnSource:
+        return self._properties, self._links
+
+    def _embedded_column_sources(self, rel: ResourceRel) -> list[ColumnSource]:
+        items = self._embedded.get(rel, [])
+        if isinstance(items, Resource):
+            items = [items]
+
+        return [item._column_source() for item in items]
+
+    @overload
+    def embedded_columns(
+        self,
+        rel: ResourceRel,
+        fields: Sequence[PropertyName] = (),
+        hrefs: Sequence[LinkRel] = (),
+        format: Literal["list", "array"] = "array",
+    ) -> dict[str, Column]: ...
+
+    @overload
+    def embedded_columns(
+        self,
+        rel: ResourceRel,
+        fields: Sequence[PropertyName] = (),
+        hrefs: Sequence[LinkRel] = (),
+        *,
+        format: ColumnFormat,
+    ) -> Any: ...
+
+    def embedded_columns(
+        self,
+        rel: ResourceRel,
+        fields: Sequence[PropertyName] = (),
+        hrefs: Sequence[LinkRel] = (),
+        format: ColumnFormat = "array",
+    ) -> Any:
+        return build_columns(
+            self._embedded_column_sources(rel), fields, hrefs, format
+        )
+
     def apply_to_resource[
         R: (LinkRel, ResourceRel, PropertyName),
         V: (LinkDict, "Resource", PropertyValue),
@@ -248,8 +587,308 @@ class Resource(object):
 
         return self
 
+    def iter_json(self) -> Iterator[str]:
+        separator = ""
+
+        yield "{"
+
+        if len(self._links) > 0:
+            yield '"_links": {'
+            yield ", ".join(
+                json.dumps(rel) + ": " + links_to_json(links)
+                for rel, links in self._links.items()
+            )
+            yield "}"
+            separator = ", "
+
+        for name, value in self._properties.items():
+            yield separator + json.dumps(name) + ": " + json.dumps(value)
+            separator = ", "
+
+        if len(self._embedded) > 0:
+            yield separator + '"_embedded": {'
+            for index, (rel, resources) in enumerate(self._embedded.items()):
+                yield (", " if index > 0 else "") + json.dumps(rel) + ": "
+                yield from iter_resources_json(resources)
+            yield "}"
+
+        yield "}"
+
+    def write_json(self, fp: SupportsWrite) -> None:
+        for chunk in self.iter_json():
+            fp.write(chunk)
+
+    def to_json(self, codec: JsonCodec | None = None) -> bytes:
+        resolved_codec = codec if codec is not None else default_codec()
+        return resolved_codec.dumps(self.to_object())
+
+    def to_object(self) -> ResourceDict:
+        links = links_to_object(self._all_link_dicts())
+        embedded = embedded_to_object(self._embedded)
+
+        return {**links, **self._properties, **embedded}
+
+
+class FrozenResource(Resource):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        properties: Mapping[PropertyName, PropertyValue] = {},
+        links: Mapping[LinkRel, LinkDict | Sequence[LinkDict]] = {},
+        embedded: Mapping[PropertyName, Resource | Sequence[Resource]] = {},
+    ) -> None:
+        super().__init__(properties, links)
+        self._links = {
+            rel: freeze_links(value) for rel, value in self._links.items()
+        }
+        self._embedded = {
+            intern(rel): freeze_resources(value)
+            for rel, value in embedded.items()
+        }
+
+    def _evolve(
+        self,
+        *,
+        links: dict[LinkRel, Link | Sequence[Link]] | None = None,
+        embedded: dict[ResourceRel, Resource | Sequence[Resource]]
+        | None = None,
+        properties: dict[PropertyName, PropertyValue] | None = None,
+    ) -> Self:
+        evolved = object.__new__(type(self))
+
+        if links is None:
+            evolved._links = self._links
+            evolved._link_index = self._link_index
+            evolved._link_dicts = self._link_dicts
+        else:
+            evolved._links = links
+            evolved._link_index = None
+            evolved._link_dicts = None
+
+        evolved._embedded = self._embedded if embedded is None else embedded
+        evolved._properties = (
+            self._properties if properties is None else properties
+        )
+
+        return evolved
+
+    def freeze(self) -> "FrozenResource":
+        return self
+
+    def get_href(self, rel: LinkRel) -> Href | Sequence[Href]:
+        return self._index().hrefs[rel]
+
+    def get_hrefs(self) -> Mapping[LinkRel, Href | Sequence[Href]]:
+        return MappingProxyType(self._index().hrefs)
+
+    def get_links(self) -> Mapping[LinkRel, LinkDict | Sequence[LinkDict]]:
+        return MappingProxyType(self._all_link_dicts())
+
+    def add_link(self, rel: LinkRel, value: LinkDict | Href | Link) -> Self:
+        links = dict(self._links)
+        append_frozen(links, rel, to_link(value))
+
+        return self._evolve(links=links)
+
+    def add_links(
+        self,
+        links: Mapping[
+            LinkRel, Href | LinkDict | Link | Sequence[LinkDict | Link]
+        ],
+    ) -> Self:
+        updated = dict(self._links)
+        for rel, value in links.items():
+            if isinstance(value, (Href, dict, Link)):
+                append_frozen(updated, rel, to_link(value))
+            else:
+                append_frozen_bulk(updated, rel, value)
+
+        return self._evolve(links=updated)
+
+    def add_links_bulk(
+        self, rel: LinkRel, links: Iterable[LinkDict | Href | Link]
+    ) -> Self:
+        updated = dict(self._links)
+        append_frozen_bulk(updated, rel, links)
+
+        return self._evolve(links=updated)
+
+    def get_resources(
+        self,
+    ) -> Mapping[ResourceRel, "Resource | Sequence[Resource]"]:
+        return MappingProxyType(self._embedded)
+
+    def get_resource(
+        self, rel: ResourceRel
+    ) -> "Resource | Sequence[Resource]":
+        return self._embedded[rel]
+
+    def add_resource(
+        self, rel: ResourceRel, value: Resource | Sequence[Resource]
+    ) -> Self:
+        embedded = dict(self._embedded)
+        append_frozen(embedded, rel, freeze_resources(value))
+
+        return self._evolve(embedded=embedded)
+
+    def add_resources(
+        self, embeds: Mapping[ResourceRel, Resource | Sequence[Resource]]
+    ) -> Self:
+        embedded = dict(self._embedded)
+        for rel, value in embeds.items():
+            append_frozen(embedded, rel, freeze_resources(value))
+
+        return self._evolve(embedded=embedded)
+
+    def add_resources_bulk(
+        self, rel: ResourceRel, resources: Iterable[Resource]
+    ) -> Self:
+        embedded = dict(self._embedded)
+        append_frozen(
+            embedded, rel, tuple(resource.freeze() for resource in resources)
+        )
+
+        return self._evolve(embedded=embedded)
+
+    def add_property(self, key: PropertyName, value: PropertyValue) -> Self:
+        return self._evolve(properties={**self._properties, key: value})
+
+    def get_properties(self) -> Properties:
+        return MappingProxyType(self._properties)
+
+    def add_properties(self, properties: Properties) -> Self:
+        return self._evolve(properties={**self._properties, **properties})
+
     def to_object(self) -> ResourceDict:
-        links = links_to_object(self._links)
+        links = links_to_object(
+            {
+                rel: list(value) if isinstance(value, tuple) else value
+                for rel, value in self._all_link_dicts().items()
+            }
+        )
         embedded = embedded_to_object(self._embedded)
 
         return {**links, **self._properties, **embedded}
+
+
+def append_frozen_bulk(
+    links: dict[LinkRel, Link | Sequence[Link]],
+    rel: LinkRel,
+    values: Iterable[LinkDict | Href | Link],
+) -> None:
+    frozen = tuple(to_link(value) for value in values)
+
+    if len(frozen) == 1 and rel not in links:
+        append_frozen(links, rel, frozen[0])
+    elif len(frozen) > 0:
+        append_frozen(links, rel, frozen)
+
+
+class TrustedResource(Resource):
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_links":
+            self._links = to_links(self._link_dicts or {})
+            return self._links
+
+        raise AttributeError(name)
+
+    def _deferred_link_dicts(
+        self,
+    ) -> dict[LinkRel, LinkDict | Sequence[LinkDict]] | None:
+        if self._is_materialised("_links"):
+            return None
+        return self._link_dicts
+
+    def _all_link_dicts(
+        self,
+    ) -> dict[LinkRel, LinkDict | Sequence[LinkDict]]:
+        link_dicts = self._deferred_link_dicts()
+        if link_dicts is not None:
+            return link_dicts
+
+        return super()._all_link_dicts()
+
+    def has_link(self, rel: LinkRel) -> bool:
+        link_dicts = self._deferred_link_dicts()
+        if link_dicts is not None:
+            return rel in link_dicts
+
+        return super().has_link(rel)
+
+    def _column_source(self) -> ColumnSource:
+        link_dicts = self._deferred_link_dicts()
+        if link_dicts is not None:
+            return self._properties, link_dicts
+
+        return super()._column_source()
+
+
+def dicts_to_lazy_resources(
+    resource_dicts: ResourceDict | Sequence[ResourceDict],
+) -> "Resource | list[Resource]":
+    if isinstance(resource_dicts, Sequence):
+        return [
+            LazyResource(resource_dict) for resource_dict in resource_dicts
+        ]
+    return LazyResource(resource_dicts)
+
+
+class LazyResource(Resource):
+    __slots__ = ("_source",)
+
+    _source: ResourceDict
+
+    def __init__(self, resource_dict: ResourceDict) -> None:
+        self._source = resource_dict
+        self._link_index = None
+        self._link_dicts = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_links":
+            self._links = (
+                Resource().add_links(self._source.get("_links", {}))._links
+            )
+            return self._links
+
+        if name == "_properties":
+            self._properties = {
+                prop: value
+                for prop, value in self._source.items()
+                if prop not in ["_links", "_embedded"]
+            }
+            return self._properties
+
+        if name == "_embedded":
+            embeds = self._source.get("_embedded", {})
+            self._embedded = {
+                intern(rel): dicts_to_lazy_resources(embeds[rel])
+                for rel in embeds
+            }
+            return self._embedded
+
+        raise AttributeError(name)
+
+    def _column_source(self) -> ColumnSource:
+        return (
+            self._properties
+            if self._is_materialised("_properties")
+            else self._source,
+            self._links
+            if self._is_materialised("_links")
+            else self._source.get("_links", {}),
+        )
+
+    def _embedded_column_sources(self, rel: ResourceRel) -> list[ColumnSource]:
+        if self._is_materialised("_embedded"):
+            return super()._embedded_column_sources(rel)
+
+        embedded = self._source.get("_embedded", {}).get(rel, [])
+        items = cast(
+            list[ResourceDict],
+            embedded if isinstance(embedded, list) else [embedded],
+        )
+
+        return [(item, item.get("_links", {})) for item in items]
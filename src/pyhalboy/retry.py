@@ -0,0 +1,168 @@
+import random
+import time
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from threading import Lock
+
+from httpx import (
+    ConnectError,
+    ConnectTimeout,
+    Request,
+    Response,
+    TransportError,
+)
+
+IDEMPOTENT_METHODS = frozenset(
+    ["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"]
+)
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, host: str):
+        super().__init__('Circuit for "{}" is open'.format(host))
+        self.host = host
+
+
+@dataclass
+class CircuitState(object):
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker(object):
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._clock = clock
+        self._hosts: dict[str, CircuitState] = {}
+        self._lock = Lock()
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return True
+
+            if state.probing or (
+                self._clock() - state.opened_at < self._recovery_time
+            ):
+                return False
+
+            state.probing = True
+            return True
+
+    def release(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is not None:
+                state.probing = False
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(host)
+            return state is not None and state.opened_at is not None
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, CircuitState())
+            state.failures += 1
+            state.probing = False
+            if state.failures >= self._failure_threshold:
+                state.opened_at = self._clock()
+
+
+def retry_after(response: Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+
+    if value.strip().isdigit():
+        return float(value)
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy(object):
+    max_attempts: int = 3
+    backoff_factor: float = 0.1
+    max_backoff: float = 10.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    circuit_breaker: CircuitBreaker | None = field(
+        default_factory=CircuitBreaker
+    )
+
+    def check(self, request: Request) -> None:
+        host = request.url.host
+        if self.circuit_breaker is not None and not (
+            self.circuit_breaker.allow(host)
+        ):
+            raise CircuitOpenError(host)
+
+    def release(self, request: Request) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.release(request.url.host)
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def delay_after_error(
+        self, request: Request, error: Exception, attempt: int
+    ) -> float | None:
+        if not isinstance(error, TransportError):
+            self.release(request)
+            return None
+
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record_failure(request.url.host)
+
+        not_sent = isinstance(error, (ConnectError, ConnectTimeout))
+        if attempt >= self.max_attempts or not (
+            not_sent or request.method in self.retry_methods
+        ):
+            return None
+
+        return self.backoff(attempt)
+
+    def delay_after_response(
+        self, request: Request, response: Response, attempt: int
+    ) -> float | None:
+        failed = response.status_code in self.retry_statuses
+
+        if self.circuit_breaker is not None:
+            if failed and response.status_code != 429:
+                self.circuit_breaker.record_failure(request.url.host)
+            else:
+                self.circuit_breaker.record_success(request.url.host)
+
+        if (
+            not failed
+            or attempt >= self.max_attempts
+            or request.method not in self.retry_methods
+        ):
+            return None
+
+        requested = retry_after(response)
+        if requested is None:
+            return self.backoff(attempt)
+
+        return requested if requested <= self.max_backoff else None
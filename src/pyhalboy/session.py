@@ -0,0 +1,140 @@
+from types import TracebackType
+from typing import Self
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    BaseTransport,
+    Client,
+    Limits,
+    Timeout,
+)
+
+from .async_navigator import AsyncNavigator, AsyncSettingsDict
+from .navigator import Navigator, SettingsDict
+from .types import Href
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+DEFAULT_TIMEOUT = 5.0
+
+
+def _limits(
+    max_connections: int | None,
+    max_keepalive_connections: int | None,
+    keepalive_expiry: float | None,
+) -> Limits:
+    return Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class NavigatorSession:
+    _client: Client
+    _settings: SettingsDict
+
+    def __init__(
+        self,
+        settings: SettingsDict = {},
+        *,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = (
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float | Timeout | None = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: BaseTransport | None = None,
+    ):
+        self._client = Client(
+            limits=_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            timeout=timeout,
+            headers=settings.get("http", {}).get("headers"),
+            http2=http2,
+            transport=transport,
+        )
+        self._settings = {**settings, "client": self._client}
+
+    @property
+    def client(self) -> Client:
+        return self._client
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def discover(self, url: Href) -> Navigator:
+        return Navigator.discover(url, self._settings)
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncNavigatorSession:
+    _client: AsyncClient
+    _settings: AsyncSettingsDict
+
+    def __init__(
+        self,
+        settings: AsyncSettingsDict = {},
+        *,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = (
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        timeout: float | Timeout | None = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        transport: AsyncBaseTransport | None = None,
+    ):
+        self._client = AsyncClient(
+            limits=_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            timeout=timeout,
+            headers=settings.get("http", {}).get("headers"),
+            http2=http2,
+            transport=transport,
+        )
+        self._settings = {**settings, "client": self._client}
+
+    @property
+    def client(self) -> AsyncClient:
+        return self._client
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    async def discover(self, url: Href) -> AsyncNavigator:
+        return await AsyncNavigator.discover(url, self._settings)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
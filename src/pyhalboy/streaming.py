@@ -0,0 +1,145 @@
+import json
+import re
+
+from typing import Any
+
+from .codec import STDLIB_CODEC, JsonCodec
+from .resource import ResourceDict
+from .types import ResourceRel
+
+_STRUCTURE = re.compile(rb'[\[\]{}:,"]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+class EmbeddedStreamParser(object):
+    _rel: ResourceRel
+    _codec: JsonCodec
+    _stack: list[int]
+    _keys: list[str | None]
+    _expect_key: bool
+    _in_string: bool
+    _escape: bool
+    _key_buffer: bytearray | None
+    _item_buffer: bytearray | None
+    _item_depth: int
+
+    def __init__(self, rel: ResourceRel, codec: JsonCodec = STDLIB_CODEC):
+        self._rel = rel
+        self._codec = codec
+        self._stack = []
+        self._keys = [None, None, None]
+        self._expect_key = False
+        self._in_string = False
+        self._escape = False
+        self._key_buffer = None
+        self._item_buffer = None
+        self._item_depth = 0
+
+    def _in_rel(self) -> bool:
+        return (
+            len(self._stack) >= 2
+            and self._keys[1] == "_embedded"
+            and self._keys[2] == self._rel
+        )
+
+    def _starts_item(self, token: int) -> bool:
+        depth = len(self._stack)
+
+        if token != ord("{"):
+            return False
+        if depth == 2:
+            return self._in_rel()
+        if depth == 3:
+            return self._stack[2] == ord("[") and self._in_rel()
+
+        return False
+
+    def _end_string(self, chunk: bytes, start: int, end: int) -> None:
+        if self._key_buffer is None:
+            return
+
+        self._key_buffer += chunk[start:end]
+        key: Any = json.loads(b'"' + self._key_buffer + b'"')
+        self._keys[len(self._stack)] = key
+        self._key_buffer = None
+
+    def _scan_string(self, chunk: bytes, start: int) -> int:
+        position = start
+
+        if self._escape:
+            self._escape = False
+            position += 1
+
+        while position < len(chunk):
+            match = _STRING_END.search(chunk, position)
+
+            if match is None:
+                break
+
+            if match.group() == b"\\":
+                if match.end() == len(chunk):
+                    self._escape = True
+                    break
+                position = match.end() + 1
+                continue
+
+            self._in_string = False
+            self._end_string(chunk, start, match.start())
+            return match.end()
+
+        if self._key_buffer is not None:
+            self._key_buffer += chunk[start:]
+
+        return len(chunk)
+
+    def feed(self, chunk: bytes) -> list[ResourceDict]:
+        items: list[ResourceDict] = []
+        item_start = 0 if self._item_buffer is not None else -1
+        position = 0
+
+        while position < len(chunk):
+            if self._in_string:
+                position = self._scan_string(chunk, position)
+                continue
+
+            match = _STRUCTURE.search(chunk, position)
+            if match is None:
+                break
+
+            token = chunk[match.start()]
+            position = match.end()
+
+            if token == ord('"'):
+                self._in_string = True
+                is_key = self._expect_key and len(self._stack) <= 2
+                self._key_buffer = bytearray() if is_key else None
+                self._expect_key = False
+            elif token == ord(":"):
+                self._expect_key = False
+            elif token == ord(","):
+                self._expect_key = self._stack[-1] == ord("{")
+            elif token == ord("{") or token == ord("["):
+                if self._item_buffer is None and self._starts_item(token):
+                    self._item_buffer = bytearray()
+                    self._item_depth = len(self._stack)
+                    item_start = match.start()
+                self._stack.append(token)
+                self._expect_key = token == ord("{")
+                if len(self._stack) < len(self._keys):
+                    self._keys[len(self._stack)] = None
+            else:
+                self._stack.pop()
+                self._expect_key = False
+                if (
+                    self._item_buffer is not None
+                    and len(self._stack) == self._item_depth
+                ):
+                    self._item_buffer += chunk[item_start:position]
+                    items.append(self._codec.loads(self._item_buffer))
+                    self._item_buffer = None
+                    item_start = -1
+
+        if self._item_buffer is not None:
+            self._item_buffer += chunk[item_start:]
+
+        return items
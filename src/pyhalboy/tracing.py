@@ -0,0 +1,68 @@
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Protocol
+
+from httpx import Request, Response
+
+type AttributeValue = str | int | float | bool
+
+type BeforeRequestHook = Callable[[Request], None]
+type AfterRequestHook = Callable[[Request, Response, float], None]
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+    def end(self) -> None: ...
+
+
+class Tracer(Protocol):
+    def start_span(
+        self, name: str, *, attributes: Mapping[str, AttributeValue]
+    ) -> Span: ...
+
+
+@dataclass
+class Timings(object):
+    template_resolution: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    resource_build: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return (
+            self.template_resolution
+            + self.network
+            + self.decode
+            + self.resource_build
+        )
+
+
+def start_request_span(tracer: Tracer | None, request: Request) -> Span | None:
+    if tracer is None:
+        return None
+
+    return tracer.start_span(
+        request.method,
+        attributes={
+            "http.request.method": request.method,
+            "url.full": str(request.url),
+        },
+    )
+
+
+def end_request_span(
+    span: Span | None,
+    response: Response | None = None,
+    error: BaseException | None = None,
+) -> None:
+    if span is None:
+        return
+
+    if response is not None:
+        span.set_attribute("http.response.status_code", response.status_code)
+    if error is not None:
+        span.set_attribute("error.type", type(error).__name__)
+
+    span.end()
@@ -0,0 +1,166 @@
+import sys
+import asyncio
+import pytest
+
+from collections.abc import Sequence
+
+import httpx
+import respx
+
+from pyhalboy.resource import Resource
+from pyhalboy.async_navigator import AsyncNavigator
+
+
+def create_user(id, name):
+    return (
+        Resource()
+        .add_link("self", "/users/{}".format(id))
+        .add_property("name", name)
+    )
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "users": {"href": "/users"},
+                    "item": [
+                        {"href": "/users/fred"},
+                        {"href": "/users/missing"},
+                        {"href": "/users/sue"},
+                    ],
+                    "user": {"href": "/users/{userId}", "templated": True},
+                },
+            },
+        )
+    )
+    router.get("/users").mock(
+        return_value=httpx.Response(
+            200,
+            json=(
+                Resource()
+                .add_link("self", "http://test.com/users")
+                .add_resource(
+                    "users",
+                    [create_user("fred", "Fred"), create_user("sue", "Sue")],
+                )
+                .to_object()
+            ),
+        )
+    )
+    router.get("/users/fred").mock(
+        return_value=httpx.Response(
+            200, json=create_user("fred", "Fred").to_object()
+        )
+    )
+    router.get("/users/sue").mock(
+        return_value=httpx.Response(
+            200, json=create_user("sue", "Sue").to_object()
+        )
+    )
+    router.get("/users/missing").mock(
+        return_value=httpx.Response(404, text="not found")
+    )
+    router.post("/users", json={"name": "Thomas"}).mock(
+        return_value=httpx.Response(
+            201,
+            headers={"Location": "http://test.com/users/thomas"},
+            json=create_user("thomas", "Thomas").to_object(),
+        )
+    )
+    return router
+
+
+def create_client(router):
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(handler=router.handler)
+    )
+
+
+class TestAsyncNavigator(object):
+    def test_discover(self):
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/",
+                settings={"client": create_client(create_router())},
+            )
+
+            assert navigator.status() == 200
+            assert navigator.resource().get_href("users") == "/users"
+
+        asyncio.run(run())
+
+    def test_get(self):
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/",
+                settings={"client": create_client(create_router())},
+            )
+
+            result = await navigator.get("users")
+            assert result.status() == 200
+
+            users = result.resource().get_resource("users")
+            assert isinstance(users, Sequence)
+            assert [u.get_property("name") for u in users] == ["Fred", "Sue"]
+
+        asyncio.run(run())
+
+    def test_get_concurrently(self):
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/",
+                settings={"client": create_client(create_router())},
+            )
+
+            results = await asyncio.gather(
+                navigator.get("user", {"userId": "fred"}),
+                navigator.get("user", {"userId": "sue"}),
+            )
+
+            names = [r.resource().get_property("name") for r in results]
+            assert names == ["Fred", "Sue"]
+
+        asyncio.run(run())
+
+    def test_get_all(self):
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/",
+                settings={"client": create_client(create_router())},
+            )
+
+            fred, missing, sue = await navigator.get_all(
+                "item", max_concurrency=2
+            )
+
+            assert isinstance(fred, AsyncNavigator)
+            assert fred.resource().get_property("name") == "Fred"
+            assert isinstance(missing, AsyncNavigator)
+            assert missing.status() == 404
+            assert isinstance(sue, AsyncNavigator)
+            assert sue.resource().get_property("name") == "Sue"
+
+        asyncio.run(run())
+
+    def test_post(self):
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/",
+                settings={"client": create_client(create_router())},
+            )
+
+            result = await navigator.post("users", {"name": "Thomas"})
+            assert result.status() == 201
+            assert (
+                result.get_header("Location") == "http://test.com/users/thomas"
+            )
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,453 @@
+import sys
+import json
+import asyncio
+import pytest
+
+import httpx
+
+from pyhalboy.async_navigator import AsyncNavigator, AsyncSettingsDict
+from pyhalboy.cache import (
+    CacheEntry,
+    DiscoveryCache,
+    FileCacheBackend,
+    InMemoryCacheBackend,
+    ResponseCache,
+)
+from pyhalboy import navigator as navigator_module
+from pyhalboy.navigator import Navigator, SettingsDict
+from pyhalboy.resource import FrozenResource, Resource
+
+
+def create_handler(requests, headers):
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(
+            200,
+            headers=headers,
+            json={"_links": {"self": {"href": "/"}}, "version": 1},
+        )
+
+    return handler
+
+
+def create_client(requests, headers):
+    return httpx.Client(
+        transport=httpx.MockTransport(create_handler(requests, headers))
+    )
+
+
+class TestResponseCache(object):
+    def test_fresh_response_is_served_from_cache(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(requests, {"cache-control": "max-age=60"}),
+            "cache": ResponseCache(),
+        }
+
+        first = Navigator.discover("http://test.com/", settings)
+        second = Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 1
+        assert second.status() == 200
+        assert second.resource().to_object() == first.resource().to_object()
+        assert second.get_header("cache-control") == "max-age=60"
+
+    def test_cached_resource_is_frozen(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(requests, {"cache-control": "max-age=60"}),
+            "cache": ResponseCache(),
+        }
+
+        first = Navigator.discover("http://test.com/", settings)
+        first.resource().add_property("version", 2)
+        second = Navigator.discover("http://test.com/", settings)
+        third = Navigator.discover("http://test.com/", settings)
+
+        assert isinstance(second.resource(), FrozenResource)
+        assert second.resource().get_property("version") == 1
+        assert third.resource() is second.resource()
+
+    def test_stale_response_is_revalidated(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(
+                requests, {"etag": '"v1"', "cache-control": "no-cache"}
+            ),
+            "cache": ResponseCache(),
+        }
+
+        first = Navigator.discover("http://test.com/", settings)
+        second = Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 2
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert second.status() == 200
+        assert second.resource().to_object() == first.resource().to_object()
+        assert second.resource().get_property("version") == 1
+
+    def test_no_store_is_not_cached(self):
+        requests = []
+        cache = ResponseCache()
+        settings: SettingsDict = {
+            "client": create_client(
+                requests, {"etag": '"v1"', "cache-control": "no-store"}
+            ),
+            "cache": cache,
+        }
+
+        Navigator.discover("http://test.com/", settings)
+        Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 2
+        assert cache.lookup(cache.key("http://test.com/", {})) is None
+
+    def test_unstorable_responses_are_not_decoded(self):
+        def handler(request):
+            if request.url.path == "/":
+                return httpx.Response(
+                    200, json={"_links": {"broken": {"href": "/broken"}}}
+                )
+            return httpx.Response(503, text="<html>unavailable</html>")
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler)),
+            "cache": ResponseCache(),
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        broken = navigator.get("broken")
+
+        assert broken.status() == 503
+        assert broken.timings().decode == 0
+
+    def test_storable_non_json_response_is_not_cached(self):
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"cache-control": "max-age=60"},
+                text="<html>home</html>",
+            )
+
+        cache = ResponseCache()
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler)),
+            "cache": cache,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        assert navigator.status() == 200
+        assert cache.lookup(cache.key("http://test.com/", {})) is None
+
+    def test_in_memory_backend_evicts_least_recently_used(self):
+        backend = InMemoryCacheBackend(max_entries=2)
+        entry = CacheEntry(
+            url="http://test.com/",
+            status_code=200,
+            headers=[],
+            resource=Resource(),
+            expires_at=0,
+        )
+
+        backend.set("a", entry)
+        backend.set("b", entry)
+        backend.get("a")
+        backend.set("c", entry)
+
+        assert len(backend) == 2
+        assert backend.get("a") is entry
+        assert backend.get("b") is None
+        assert backend.get("c") is entry
+
+    def test_file_backend(self, tmp_path):
+        requests = []
+        backend = FileCacheBackend(str(tmp_path))
+        settings: SettingsDict = {
+            "client": create_client(requests, {"cache-control": "max-age=60"}),
+            "cache": ResponseCache(backend),
+        }
+
+        Navigator.discover("http://test.com/", settings)
+        cached = Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 1
+        assert cached.resource().get_property("version") == 1
+
+        backend.clear()
+        assert backend.get("http://test.com/") is None
+
+    def test_file_backend_round_trip(self, tmp_path):
+        backend = FileCacheBackend(str(tmp_path))
+        entry = CacheEntry(
+            url="http://test.com/",
+            status_code=200,
+            headers=[("etag", '"v1"'), ("vary", "a"), ("vary", "b")],
+            resource=Resource()
+            .add_link("self", "/")
+            .add_property("version", 1)
+            .freeze(),
+            expires_at=10.5,
+        )
+
+        backend.set("key", entry)
+        restored = backend.get("key")
+
+        assert restored is not None
+        assert restored.headers == entry.headers
+        assert restored.expires_at == 10.5
+        assert restored.resource.to_object() == entry.resource.to_object()
+        assert isinstance(restored.resource, FrozenResource)
+        (path,) = tmp_path.iterdir()
+        assert json.loads(path.read_bytes())["url"] == "http://test.com/"
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"\x80\x04\x95garbage",
+            b"[]",
+            b'{"url": "http://test.com/"}',
+            b'{"url": 1, "status_code": 200, "headers": [],'
+            b' "resource": {}, "expires_at": 0}',
+            b'{"url": "/", "status_code": 200, "headers": [1],'
+            b' "resource": {}, "expires_at": 0}',
+            b'{"url": "/", "status_code": 200, "headers": [],'
+            b' "resource": {"_links": 5}, "expires_at": 0}',
+            b"9" * 100000,
+        ],
+    )
+    def test_file_backend_treats_corrupt_entries_as_misses(
+        self, tmp_path, content
+    ):
+        backend = FileCacheBackend(str(tmp_path))
+        backend.set(
+            "key",
+            CacheEntry(
+                url="http://test.com/",
+                status_code=200,
+                headers=[],
+                resource=Resource(),
+                expires_at=0,
+            ),
+        )
+        (path,) = tmp_path.iterdir()
+        path.write_bytes(content)
+
+        assert backend.get("key") is None
+
+    def test_async_navigator(self):
+        requests = []
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                create_handler(requests, {"etag": '"v1"'})
+            )
+        )
+        settings: AsyncSettingsDict = {
+            "client": client,
+            "cache": ResponseCache(),
+        }
+
+        async def run():
+            first = await AsyncNavigator.discover("http://test.com/", settings)
+            second = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+
+            assert isinstance(second.resource(), FrozenResource)
+            assert (
+                second.resource().to_object() == first.resource().to_object()
+            )
+
+        asyncio.run(run())
+
+        assert requests[1].headers["if-none-match"] == '"v1"'
+
+
+class TestDiscoveryCache(object):
+    def test_discover_is_memoized(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": DiscoveryCache(),
+        }
+
+        first = Navigator.discover("http://test.com/", settings)
+        second = Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 1
+        assert second.status() == 200
+        assert second.resource().to_object() == first.resource().to_object()
+        assert isinstance(second.resource(), FrozenResource)
+
+    def test_memoization_is_keyed_by_headers(self):
+        requests = []
+        discovery_cache = DiscoveryCache()
+        client = create_client(requests, {})
+
+        Navigator.discover(
+            "http://test.com/",
+            {
+                "client": client,
+                "discovery_cache": discovery_cache,
+                "http": {"headers": {"authorization": "token-1"}},
+            },
+        )
+        Navigator.discover(
+            "http://test.com/",
+            {
+                "client": client,
+                "discovery_cache": discovery_cache,
+                "http": {"headers": {"Authorization": "token-2"}},
+            },
+        )
+
+        assert len(requests) == 2
+        assert len(discovery_cache) == 2
+
+    def test_memoization_is_keyed_by_client_headers(self):
+        requests = []
+        discovery_cache = DiscoveryCache()
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200, json={"user": request.headers["authorization"]}
+            )
+
+        def discover(token):
+            client = httpx.Client(
+                headers={"Authorization": token},
+                transport=httpx.MockTransport(handler),
+            )
+            return Navigator.discover(
+                "http://test.com/",
+                {"client": client, "discovery_cache": discovery_cache},
+            )
+
+        first = discover("token-1")
+        second = discover("token-2")
+        third = discover("token-1")
+
+        assert len(requests) == 2
+        assert first.resource().get_property("user") == "token-1"
+        assert second.resource().get_property("user") == "token-2"
+        assert third.resource() is not second.resource()
+        assert third.resource().get_property("user") == "token-1"
+
+    def test_hit_does_not_construct_a_client(self, monkeypatch):
+        requests = []
+        clients = []
+
+        class CountingClient(httpx.Client):
+            def __init__(self):
+                super().__init__(
+                    transport=httpx.MockTransport(create_handler(requests, {}))
+                )
+                clients.append(self)
+
+        monkeypatch.setattr(navigator_module, "Client", CountingClient)
+        settings: SettingsDict = {"discovery_cache": DiscoveryCache()}
+
+        first = Navigator.discover("http://test.com/", settings)
+        second = Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 1
+        assert len(clients) == 1
+        assert second._settings.client is first._settings.client
+
+    def test_cached_entry_is_frozen(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": DiscoveryCache(),
+        }
+
+        first = Navigator.discover("http://test.com/", settings)
+        first.resource().add_property("version", 2)
+        second = Navigator.discover("http://test.com/", settings)
+
+        assert second.resource().get_property("version") == 1
+
+    def test_least_recently_used_entries_are_evicted(self):
+        requests = []
+        discovery_cache = DiscoveryCache(max_entries=2)
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": discovery_cache,
+        }
+
+        Navigator.discover("http://test.com/a", settings)
+        Navigator.discover("http://test.com/b", settings)
+        Navigator.discover("http://test.com/a", settings)
+        Navigator.discover("http://test.com/c", settings)
+        Navigator.discover("http://test.com/a", settings)
+        Navigator.discover("http://test.com/b", settings)
+
+        assert len(requests) == 4
+        assert len(discovery_cache) == 2
+
+    def test_expired_entries_are_pruned_on_store(self):
+        requests = []
+        discovery_cache = DiscoveryCache(ttl=0)
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": discovery_cache,
+        }
+
+        Navigator.discover("http://test.com/a", settings)
+        Navigator.discover("http://test.com/b", settings)
+
+        assert len(discovery_cache) == 0
+
+    def test_expired_entries_are_refetched(self):
+        requests = []
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": DiscoveryCache(ttl=0),
+        }
+
+        Navigator.discover("http://test.com/", settings)
+        Navigator.discover("http://test.com/", settings)
+
+        assert len(requests) == 2
+
+    def test_invalidate(self):
+        requests = []
+        discovery_cache = DiscoveryCache()
+        settings: SettingsDict = {
+            "client": create_client(requests, {}),
+            "discovery_cache": discovery_cache,
+        }
+
+        Navigator.discover("http://test.com/", settings)
+        discovery_cache.invalidate("http://test.com/")
+        Navigator.discover("http://test.com/", settings)
+        discovery_cache.invalidate()
+
+        assert len(requests) == 2
+        assert len(discovery_cache) == 0
+
+    def test_async_discover_is_memoized(self):
+        requests = []
+        settings: AsyncSettingsDict = {
+            "client": httpx.AsyncClient(
+                transport=httpx.MockTransport(create_handler(requests, {}))
+            ),
+            "discovery_cache": DiscoveryCache(),
+        }
+
+        async def run():
+            await AsyncNavigator.discover("http://test.com/", settings)
+            await AsyncNavigator.discover("http://test.com/", settings)
+
+        asyncio.run(run())
+
+        assert len(requests) == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,94 @@
+import sys
+import pytest
+
+import httpx
+
+from pyhalboy.codec import (
+    STDLIB_CODEC,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+from pyhalboy.navigator import Navigator
+from pyhalboy.resource import Resource
+
+
+def create_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec in [OrjsonCodec, MsgspecCodec]:
+        try:
+            codecs.append(codec())
+        except ImportError:
+            pass
+    return codecs
+
+
+def create_order():
+    return (
+        Resource()
+        .add_link("self", "/orders/123")
+        .add_link("ea:item", "/items/1")
+        .add_link("ea:item", "/items/2")
+        .add_property("state", "dispatching")
+        .add_property("total", 10.5)
+        .add_resource("ea:basket", Resource().add_property("items", [1, 2]))
+    )
+
+
+class RecordingCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.calls = []
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.calls.append("dumps")
+        return super().dumps(value)
+
+
+class TestCodec(object):
+    @pytest.mark.parametrize("codec", create_codecs())
+    def test_round_trip(self, codec):
+        order = create_order()
+
+        data = order.to_json(codec)
+        restored = Resource.from_json(data, codec=codec)
+
+        assert isinstance(data, bytes)
+        assert restored.to_object() == order.to_object()
+
+    def test_default_codec(self):
+        codec = default_codec()
+
+        assert codec is default_codec()
+        assert codec.loads(codec.dumps({"a": [1]})) == {"a": [1]}
+
+    def test_stdlib_codec_is_compact(self):
+        assert STDLIB_CODEC.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_navigator_uses_settings_codec(self):
+        codec = RecordingCodec()
+
+        def handler(request):
+            if request.method == "POST":
+                assert request.headers["content-type"] == "application/json"
+                return httpx.Response(201, content=request.content)
+            return httpx.Response(
+                200, json={"_links": {"users": {"href": "/users"}}}
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client, "codec": codec}
+        )
+        result = navigator.post("users", {"name": "Thomas"})
+
+        assert result.resource().get_property("name") == "Thomas"
+        assert codec.calls == ["loads", "dumps", "loads"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
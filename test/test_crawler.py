@@ -0,0 +1,197 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+import respx
+
+from pyhalboy import AsyncNavigator, Navigator
+from pyhalboy.async_navigator import AsyncSettingsDict
+from pyhalboy.crawler import (
+    AsyncCrawler,
+    CrawlError,
+    Crawler,
+    HostRateLimiter,
+)
+from pyhalboy.navigator import SettingsDict
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "self": {"href": "/"},
+                    "users": {"href": "/users"},
+                    "search": {"href": "/users{?q}", "templated": True},
+                    "docs": {"href": "http://docs.com/api"},
+                    "broken": {"href": "/broken"},
+                },
+            },
+        )
+    )
+    router.get("/users").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {"self": {"href": "/users"}, "home": {"href": "/"}},
+                "_embedded": {
+                    "users": [
+                        {
+                            "_links": {
+                                "self": {"href": "/users/1"},
+                                "orders": {"href": "/users/1/orders"},
+                            },
+                            "name": "Fred",
+                        },
+                        {
+                            "_links": {"self": {"href": "/users/2"}},
+                            "name": "Sue",
+                        },
+                    ]
+                },
+            },
+        )
+    )
+    router.get("/users/1/orders").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "self": {"href": "/users/1/orders"},
+                    "user": {"href": "/users/1#profile"},
+                }
+            },
+        )
+    )
+    router.get("/broken").mock(return_value=httpx.Response(404, json={}))
+    return router
+
+
+def requested_paths(router: respx.Router) -> list[str]:
+    return sorted(call.request.url.path for call in router.calls)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCrawler(object):
+    def test_crawls_links_and_embedded_resources(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            )
+        }
+        errors: list[tuple[str, Exception]] = []
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        results = dict(
+            Crawler(
+                max_workers=2,
+                on_error=lambda url, error: errors.append((url, error)),
+            ).crawl(navigator)
+        )
+
+        assert sorted(results) == [
+            "http://test.com/",
+            "http://test.com/users",
+            "http://test.com/users/1",
+            "http://test.com/users/1/orders",
+            "http://test.com/users/2",
+        ]
+        assert results["http://test.com/users/2"].get_property("name") == (
+            "Sue"
+        )
+        assert requested_paths(router) == [
+            "/",
+            "/broken",
+            "/users",
+            "/users/1/orders",
+        ]
+        assert [url for url, _ in errors] == ["http://test.com/broken"]
+        assert isinstance(errors[0][1], CrawlError)
+
+    def test_max_depth(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            )
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        results = [url for url, _ in Crawler(max_depth=1).crawl(navigator)]
+
+        assert sorted(results) == [
+            "http://test.com/",
+            "http://test.com/users",
+        ]
+
+    def test_stopping_early(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            )
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        crawl = Crawler().crawl(navigator)
+
+        assert next(crawl)[0] == "http://test.com/"
+        crawl.close()
+
+    def test_rate_limiter_spaces_requests_per_host(self):
+        clock = FakeClock()
+        limiter = HostRateLimiter(
+            rate=2, host_rates={"slow.com": 0.5}, clock=clock
+        )
+
+        assert [limiter.reserve("test.com") for _ in range(3)] == [
+            0,
+            0.5,
+            1.0,
+        ]
+        assert [limiter.reserve("slow.com") for _ in range(2)] == [0, 2.0]
+
+        clock.now = 5
+        assert limiter.reserve("test.com") == 0
+
+    def test_unlimited_rate(self):
+        assert HostRateLimiter().reserve("test.com") == 0
+
+    def test_async_crawler(self):
+        async def run():
+            router = create_router()
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(
+                    transport=httpx.MockTransport(router.handler)
+                )
+            }
+
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+            results = [url async for url, _ in AsyncCrawler().crawl(navigator)]
+
+            assert sorted(results) == [
+                "http://test.com/",
+                "http://test.com/users",
+                "http://test.com/users/1",
+                "http://test.com/users/1/orders",
+                "http://test.com/users/2",
+            ]
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
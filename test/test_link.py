@@ -0,0 +1,62 @@
+import sys
+import pickle
+import pytest
+
+from pyhalboy import Link, Resource
+
+
+class TestLink(object):
+    def test_from_dict(self):
+        link = Link.from_dict(
+            {"href": "/users/{id}", "templated": True, "title": "User"}
+        )
+
+        assert link.href == "/users/{id}"
+        assert link.templated is True
+        assert link.title == "User"
+        assert link.name is None
+
+    def test_to_dict_round_trip(self):
+        link_dict = {
+            "href": "/users/fred",
+            "name": "fred",
+            "type": "application/hal+json",
+            "x-custom": {"weight": 3},
+        }
+
+        assert Link.from_dict(link_dict).to_dict() == link_dict
+
+    def test_equality(self):
+        assert Link("/users", title="Users") == Link.from_dict(
+            {"href": "/users", "title": "Users"}
+        )
+        assert Link("/users") != Link("/users", title="Users")
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(Link("/users"), "__dict__")
+        assert not hasattr(Resource(), "__dict__")
+
+    def test_pickle(self):
+        link = Link("/users", name="users", extra={"x-custom": 1})
+
+        assert pickle.loads(pickle.dumps(link)) == link
+
+    def test_resource_accepts_links(self):
+        resource = Resource().add_link("self", Link("/orders", title="Orders"))
+
+        assert resource.get_link("self") == {
+            "href": "/orders",
+            "title": "Orders",
+        }
+
+    def test_rels_are_interned(self):
+        rel = "".join(["ea:", "customer"])
+        resource = Resource.from_object(
+            {"_links": {rel: {"href": "/customers/1"}}}
+        )
+
+        assert next(iter(resource.get_links())) is sys.intern(rel)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -4,7 +4,11 @@ import pytest
 import httpx
 import respx
 
-from pyhalboy.navigator import Navigator
+from pyhalboy.navigator import (
+    Navigator,
+    clear_template_cache,
+    template_cache_info,
+)
 
 
 class TestNavigatorTestCase(object):
@@ -35,6 +39,48 @@ class TestNavigatorTestCase(object):
         href = navigator.resource().get_href("users")
         assert href == "/users"
 
+    def test_template_cache(self):
+        router = respx.Router(base_url="http://test.com")
+        router.get("/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "_links": {
+                        "users": {"href": "/users"},
+                        "user": {"href": "/users/{id}", "templated": True},
+                    },
+                },
+            )
+        )
+        router.get("/users").mock(
+            return_value=httpx.Response(200, json={"count": 2})
+        )
+        router.get("/users/fred").mock(
+            return_value=httpx.Response(200, json={"name": "Fred"})
+        )
+        router.get("/users/sue").mock(
+            return_value=httpx.Response(200, json={"name": "Sue"})
+        )
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler=router.handler)
+        )
+        clear_template_cache()
+
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+        navigator.get("users")
+        fred = navigator.get("user", {"id": "fred"})
+        sue = navigator.get("user", {"id": "sue"})
+
+        assert fred.resource().get_property("name") == "Fred"
+        assert sue.resource().get_property("name") == "Sue"
+
+        info = template_cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert info.size == 1
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
@@ -0,0 +1,191 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+import respx
+
+from pyhalboy import AsyncNavigator, Navigator
+from pyhalboy.async_navigator import AsyncSettingsDict
+from pyhalboy import navigator as navigator_module
+from pyhalboy.navigator import SettingsDict
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "self": {"href": "/"},
+                    "users": [{"href": "/users/1"}, {"href": "/users/2"}],
+                    "search": {"href": "/users{?q}", "templated": True},
+                },
+                "_embedded": {
+                    "users": [
+                        {
+                            "_links": {"self": {"href": "/users/1"}},
+                            "name": "embedded-1",
+                        }
+                    ]
+                },
+            },
+        )
+    )
+    router.get("/users/1").mock(
+        return_value=httpx.Response(200, json={"name": "fetched-1"})
+    )
+    router.get("/users/2").mock(
+        return_value=httpx.Response(200, json={"name": "fetched-2"})
+    )
+    router.get("/users").mock(
+        return_value=httpx.Response(200, json={"count": 0})
+    )
+    return router
+
+
+def requested_paths(router: respx.Router) -> list[str]:
+    return [call.request.url.path for call in router.calls]
+
+
+class TestEmbeddedFirstResolution(object):
+    def test_get_uses_embedded_resource_when_enabled(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            ),
+            "prefer_embedded": True,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        user = navigator.get("users")
+
+        assert user.is_synthetic()
+        assert user.status() is None
+        assert user.location() == "http://test.com/users/1"
+        assert user.resource().get_property("name") == "embedded-1"
+        assert requested_paths(router) == ["/"]
+
+        with pytest.raises(KeyError):
+            user.get_header("content-type")
+
+    def test_get_fetches_when_disabled(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            ),
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        user = navigator.get("users")
+
+        assert not user.is_synthetic()
+        assert user.status() == 200
+        assert user.resource().get_property("name") == "fetched-1"
+
+    def test_get_all_mixes_embedded_and_fetched(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            ),
+            "prefer_embedded": True,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        users = navigator.get_all("users")
+
+        names = [
+            user.resource().get_property("name")
+            for user in users
+            if isinstance(user, Navigator)
+        ]
+        assert names == ["embedded-1", "fetched-2"]
+        assert requested_paths(router) == ["/", "/users/2"]
+
+    def test_get_all_indexes_embedded_resources_once(self, monkeypatch):
+        count = 500
+        document = {
+            "_links": {
+                "item": [{"href": "/items/{}".format(i)} for i in range(count)]
+            },
+            "_embedded": {
+                "item": [
+                    {"_links": {"self": {"href": "/items/{}".format(i)}}}
+                    for i in range(count)
+                ]
+            },
+        }
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=document)
+
+        calls = []
+        make_absolute = navigator_module.make_absolute
+
+        def counting_make_absolute(base, href):
+            calls.append(href)
+            return make_absolute(base, href)
+
+        monkeypatch.setattr(
+            navigator_module, "make_absolute", counting_make_absolute
+        )
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler)),
+            "prefer_embedded": True,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        items = navigator.get_all("item")
+
+        assert len(requests) == 1
+        assert all(
+            isinstance(item, Navigator) and item.is_synthetic()
+            for item in items
+        )
+        assert len(calls) == 2 * count
+
+    def test_query_params_always_fetch(self):
+        router = create_router()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(router.handler)
+            ),
+            "prefer_embedded": True,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        result = navigator.get("search", {"q": "thomas"})
+
+        assert not result.is_synthetic()
+        assert requested_paths(router) == ["/", "/users"]
+
+    def test_async_get_uses_embedded_resource(self):
+        async def run():
+            router = create_router()
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(
+                    transport=httpx.MockTransport(router.handler)
+                ),
+                "prefer_embedded": True,
+            }
+
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+            user = await navigator.get("users")
+
+            assert user.is_synthetic()
+            assert user.resource().get_property("name") == "embedded-1"
+            assert requested_paths(router) == ["/"]
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -104,6 +104,110 @@ class TestNavigatorGet(object):
         assert result.status() == 200
         assert result.resource().get_property("name") == "Fred"
 
+    def test_get_preserves_link_query_and_consumes_variables(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "_links": {
+                        "page": {"href": "/users?page=2"},
+                        "user": {"href": "/users/{id}", "templated": True},
+                    }
+                },
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+
+        navigator.get("page")
+        navigator.get("page", {"size": "10"})
+        navigator.get("user", {"id": "fred", "expand": "orders"})
+
+        assert [str(request.url) for request in requests[1:]] == [
+            "http://test.com/users?page=2",
+            "http://test.com/users?page=2&size=10",
+            "http://test.com/users/fred?expand=orders",
+        ]
+
+    def test_get_all(self):
+        router = respx.Router(base_url="http://test.com")
+        router.get("/").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "_links": {
+                        "item": [
+                            {"href": "/users/fred"},
+                            {"href": "/users/missing"},
+                            {"href": "/users/sue"},
+                        ]
+                    },
+                },
+            )
+        )
+        router.get("/users/fred").mock(
+            return_value=httpx.Response(
+                200, json=create_user("fred", "Fred").to_object()
+            )
+        )
+        router.get("/users/missing").mock(
+            return_value=httpx.Response(404, text="not found")
+        )
+        router.get("/users/sue").mock(
+            return_value=httpx.Response(
+                200, json=create_user("sue", "Sue").to_object()
+            )
+        )
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler=router.handler)
+        )
+
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+
+        fred, missing, sue = navigator.get_all("item", max_concurrency=2)
+
+        assert isinstance(fred, Navigator)
+        assert fred.resource().get_property("name") == "Fred"
+        assert isinstance(missing, Navigator)
+        assert missing.status() == 404
+        with pytest.raises(Exception):
+            missing.resource()
+        assert isinstance(sue, Navigator)
+        assert sue.resource().get_property("name") == "Sue"
+
+    def test_get_all_single_link(self):
+        router = respx.Router(base_url="http://test.com")
+        router.get("/").mock(
+            return_value=httpx.Response(
+                200, json={"_links": {"item": {"href": "/users/fred"}}}
+            )
+        )
+        router.get("/users/fred").mock(
+            return_value=httpx.Response(
+                200, json=create_user("fred", "Fred").to_object()
+            )
+        )
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler=router.handler)
+        )
+
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+
+        results = navigator.get_all("item")
+
+        assert len(results) == 1
+        assert isinstance(results[0], Navigator)
+        assert results[0].resource().get_property("name") == "Fred"
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
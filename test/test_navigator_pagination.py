@@ -0,0 +1,176 @@
+import sys
+import time
+import asyncio
+import pytest
+
+import httpx
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pyhalboy.async_navigator import AsyncNavigator
+from pyhalboy.codec import StdlibJsonCodec
+from pyhalboy.navigator import Navigator, SettingsDict
+from pyhalboy.resource import Resource
+
+
+def create_page(page, pages):
+    resource = (
+        Resource()
+        .add_link("self", "/users?page={}".format(page))
+        .add_resource(
+            "users",
+            [
+                Resource().add_property("name", "user-{}-{}".format(page, i))
+                for i in range(2)
+            ],
+        )
+    )
+    if page < pages:
+        resource.add_link("next", "/users?page={}".format(page + 1))
+    return resource
+
+
+def create_handler(requests, pages):
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/":
+            return httpx.Response(
+                200, json={"_links": {"users": {"href": "/users?page=1"}}}
+            )
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=create_page(page, pages).to_object())
+
+    return handler
+
+
+class SlowCountingCodec(StdlibJsonCodec):
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(data)
+        time.sleep(self.delay)
+        return super().loads(data)
+
+
+def discover(requests, pages, codec=None):
+    client = httpx.Client(
+        transport=httpx.MockTransport(create_handler(requests, pages))
+    )
+    settings: SettingsDict = {"client": client}
+    if codec is not None:
+        settings["codec"] = codec
+    return Navigator.discover("http://test.com/", settings=settings)
+
+
+def async_discover(requests, pages):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(create_handler(requests, pages))
+    )
+    return AsyncNavigator.discover(
+        "http://test.com/", settings={"client": client}
+    )
+
+
+class TestNavigatorPagination(object):
+    def test_iter_pages(self):
+        requests = []
+        users = discover(requests, pages=3).get("users")
+
+        pages = [
+            page.resource().get_href("self") for page in users.iter_pages()
+        ]
+
+        assert pages == ["/users?page=1", "/users?page=2", "/users?page=3"]
+        assert len(requests) == 4
+
+    def test_iter_items(self):
+        users = discover([], pages=2).get("users")
+
+        names = [
+            user.get_property("name")
+            for user in users.iter_items("users", prefetch=3)
+        ]
+
+        assert names == ["user-1-0", "user-1-1", "user-2-0", "user-2-1"]
+
+    def test_prefetched_pages_are_decoded_once(self):
+        requests = []
+        codec = SlowCountingCodec()
+        users = discover(requests, pages=20, codec=codec).get("users")
+
+        items = list(users.iter_items("users", prefetch=2))
+
+        assert len(items) == 40
+        assert len(codec.decoded) == len(requests)
+
+    def test_concurrent_resource_calls_share_one_resource(self):
+        codec = SlowCountingCodec()
+        users = discover([], pages=1, codec=codec).get("users")
+        decoded = len(codec.decoded)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resources = list(
+                executor.map(lambda _: users.resource(), range(32))
+            )
+
+        assert len(codec.decoded) == decoded + 1
+        assert all(resource is resources[0] for resource in resources)
+
+    def test_iter_pages_without_prefetch(self):
+        requests = []
+        users = discover(requests, pages=5).get("users")
+
+        pages = users.iter_pages(prefetch=0)
+        next(pages)
+        next(pages)
+        pages.close()
+
+        assert len(requests) == 3
+
+    def test_early_stop_bounds_prefetch(self):
+        requests = []
+        users = discover(requests, pages=10).get("users")
+
+        for _ in users.iter_pages(prefetch=2):
+            break
+
+        assert len(requests) <= 4
+
+    def test_async_iter_items(self):
+        async def run():
+            navigator = await async_discover([], pages=3)
+            users = await navigator.get("users")
+            return [
+                user.get_property("name")
+                async for user in users.iter_items("users", prefetch=2)
+            ]
+
+        assert asyncio.run(run()) == [
+            "user-1-0",
+            "user-1-1",
+            "user-2-0",
+            "user-2-1",
+            "user-3-0",
+            "user-3-1",
+        ]
+
+    def test_async_early_stop_cancels_prefetch(self):
+        requests = []
+
+        async def run():
+            navigator = await async_discover(requests, pages=10)
+            users = await navigator.get("users")
+            pages = users.iter_pages(prefetch=3)
+            async for _ in pages:
+                break
+            await pages.aclose()
+
+        asyncio.run(run())
+
+        assert len(requests) <= 5
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
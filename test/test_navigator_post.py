@@ -1,4 +1,6 @@
 import sys
+import json
+import asyncio
 import pytest
 
 
@@ -6,7 +8,8 @@ import httpx
 import respx
 
 from pyhalboy.resource import Resource
-from pyhalboy.navigator import Navigator
+from pyhalboy.navigator import Navigator, PostResult, SettingsDict
+from pyhalboy.async_navigator import AsyncNavigator, AsyncSettingsDict
 
 
 def create_user(id, name):
@@ -17,6 +20,23 @@ def create_user(id, name):
     )
 
 
+def users_handler(request: httpx.Request) -> httpx.Response:
+    if request.method == "GET":
+        return httpx.Response(
+            200, json={"_links": {"users": {"href": "/users"}}}
+        )
+
+    name = json.loads(request.content)["name"]
+    if name == "invalid":
+        return httpx.Response(422, json={"error": "invalid"})
+
+    return httpx.Response(
+        201,
+        headers={"Location": "/users/{}".format(name)},
+        json=create_user(name, name).to_object(),
+    )
+
+
 class TestNavigatorPost(object):
     def test_post(self):
         router = respx.Router(base_url="http://test.com")
@@ -51,6 +71,210 @@ class TestNavigatorPost(object):
         assert result.status() == 200
         assert result.get_header("Location") == "http://test.com/users/thomas"
 
+    def test_post_with_empty_body_is_not_parsed(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(
+                    204, headers={"Location": "/users/thomas"}
+                )
+            return users_handler(request)
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler))
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        result = navigator.post("users", {"name": "Thomas"})
+
+        assert result.status() == 204
+        assert result.get_header("Location") == "/users/thomas"
+        assert result.resource().to_object() == {}
+
+    def test_non_json_body_is_decoded_on_first_use(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(202, text="accepted")
+            return users_handler(request)
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler))
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        result = navigator.post("users", {"name": "Thomas"})
+
+        assert result.status() == 202
+        assert result.timings().decode == 0
+        with pytest.raises(Exception):
+            result.resource()
+
+    def test_resource_is_memoized(self):
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(handler=users_handler)
+            )
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        result = navigator.post("users", {"name": "thomas"})
+
+        assert result.resource() is result.resource()
+
+    def test_post_many(self):
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(handler=users_handler)
+            )
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        results = navigator.post_many(
+            "users",
+            [{"name": "thomas"}, {"name": "invalid"}, {"name": "sue"}],
+            max_concurrency=2,
+        )
+
+        assert [
+            result.status()
+            for result in results
+            if isinstance(result, Navigator)
+        ] == [201, 422, 201]
+        first = results[0]
+        assert isinstance(first, Navigator)
+        assert first.resource().get_property("name") == "thomas"
+
+    def test_post_many_without_parsing(self):
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(handler=users_handler)
+            )
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        results = navigator.post_many(
+            "users", [{"name": "thomas"}, {"name": "invalid"}], parse=False
+        )
+
+        assert results == [
+            PostResult(status=201, location="http://test.com/users/thomas"),
+            PostResult(status=422, location=None),
+        ]
+
+    def test_post_many_reports_errors_per_item(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST" and b"fail" in request.content:
+                raise httpx.ConnectError("refused", request=request)
+            return users_handler(request)
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler))
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        results = navigator.post_many(
+            "users", [{"name": "fail"}, {"name": "sue"}], parse=False
+        )
+
+        assert isinstance(results[0], httpx.ConnectError)
+        assert results[1] == PostResult(
+            status=201, location="http://test.com/users/sue"
+        )
+
+    def test_post_many_pulls_bodies_as_requests_finish(self):
+        finished = []
+        ahead = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = users_handler(request)
+            if request.method == "POST":
+                finished.append(request)
+            return response
+
+        def bodies():
+            for index in range(20):
+                ahead.append(index - len(finished))
+                yield {"name": "user-{}".format(index)}
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler))
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        results = navigator.post_many(
+            "users", bodies(), max_concurrency=3, parse=False
+        )
+
+        assert max(ahead) <= 3
+        assert [
+            result.location
+            for result in results
+            if isinstance(result, PostResult)
+        ] == ["http://test.com/users/user-{}".format(i) for i in range(20)]
+
+    def test_async_post_many_pulls_bodies_as_requests_finish(self):
+        finished = []
+        ahead = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = users_handler(request)
+            if request.method == "POST":
+                finished.append(request)
+            return response
+
+        def bodies():
+            for index in range(20):
+                ahead.append(index - len(finished))
+                yield {"name": "user-{}".format(index)}
+
+        async def run():
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+            }
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+
+            return await navigator.post_many(
+                "users", bodies(), max_concurrency=3, parse=False
+            )
+
+        results = asyncio.run(run())
+
+        assert max(ahead) <= 3
+        assert [
+            result.location
+            for result in results
+            if isinstance(result, PostResult)
+        ] == ["http://test.com/users/user-{}".format(i) for i in range(20)]
+
+    def test_async_post_many(self):
+        async def run():
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler=users_handler)
+                )
+            }
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+
+            results = await navigator.post_many(
+                "users",
+                [{"name": "thomas"}, {"name": "sue"}],
+                max_concurrency=1,
+                parse=False,
+            )
+
+            assert [
+                result.location
+                for result in results
+                if isinstance(result, PostResult)
+            ] == ["http://test.com/users/thomas", "http://test.com/users/sue"]
+
+        asyncio.run(run())
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
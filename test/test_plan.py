@@ -0,0 +1,186 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+import respx
+
+from pyhalboy import (
+    AsyncNavigationPlan,
+    AsyncNavigator,
+    NavigationPlan,
+    Navigator,
+    PlanStep,
+)
+from pyhalboy.async_navigator import AsyncSettingsDict
+from pyhalboy.navigator import SettingsDict
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200, json={"_links": {"orders": {"href": "/orders"}}}
+        )
+    )
+    router.get("/orders").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "order": {"href": "/orders/{id}", "templated": True}
+                }
+            },
+        )
+    )
+    for order_id in ["1", "2", "3"]:
+        router.get("/orders/{}".format(order_id)).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "_links": {
+                        "customer": {"href": "/customers/{}".format(order_id)}
+                    }
+                },
+            )
+        )
+        router.get("/customers/{}".format(order_id)).mock(
+            return_value=httpx.Response(
+                200, json={"name": "customer-{}".format(order_id)}
+            )
+        )
+    return router
+
+
+def requested_paths(router: respx.Router) -> list[str]:
+    return [call.request.url.path for call in router.calls]
+
+
+plan_steps = ["orders", PlanStep("order", variables=["id"]), "customer"]
+
+
+class TestNavigationPlan(object):
+    def test_executes_plan_for_each_parameter_set(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        root = Navigator.discover("http://test.com/", settings)
+        results = NavigationPlan(plan_steps).execute(
+            root, [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        )
+
+        names = [
+            result.resource().get_property("name")
+            for result in results
+            if isinstance(result, Navigator)
+        ]
+        assert names == ["customer-1", "customer-2", "customer-3"]
+
+    def test_shared_hops_are_fetched_once(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        root = Navigator.discover("http://test.com/", settings)
+        plan = NavigationPlan(plan_steps)
+        plan.execute(root, [{"id": "1"}, {"id": "1"}, {"id": "2"}])
+        plan.execute(root, [{"id": "3"}])
+
+        assert sorted(requested_paths(router)) == [
+            "/",
+            "/customers/1",
+            "/customers/2",
+            "/customers/3",
+            "/orders",
+            "/orders/1",
+            "/orders/2",
+            "/orders/3",
+        ]
+
+    def test_invalidate_drops_shared_hops(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        root = Navigator.discover("http://test.com/", settings)
+        plan = NavigationPlan(plan_steps)
+        plan.execute(root, [{"id": "1"}])
+        plan.invalidate()
+        plan.execute(root, [{"id": "1"}])
+
+        assert requested_paths(router).count("/orders") == 2
+
+    def test_shared_hops_are_keyed_by_request_headers(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        plan = NavigationPlan(plan_steps)
+
+        for token in ["token-1", "token-2", "token-1"]:
+            settings: SettingsDict = {
+                "client": httpx.Client(
+                    headers={"Authorization": token}, transport=transport
+                )
+            }
+            root = Navigator.discover("http://test.com/", settings)
+            plan.execute(root, [{"id": "1"}])
+
+        orders = [
+            call.request.headers["authorization"]
+            for call in router.calls
+            if call.request.url.path == "/orders"
+        ]
+        assert orders == ["token-1", "token-2"]
+
+    def test_shared_hops_expire(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        root = Navigator.discover("http://test.com/", settings)
+        plan = NavigationPlan(plan_steps, ttl=0)
+        plan.execute(root, [{"id": "1"}])
+        plan.execute(root, [{"id": "1"}])
+
+        assert requested_paths(router).count("/orders") == 2
+
+    def test_failures_are_returned_per_parameter_set(self):
+        router = create_router()
+        transport = httpx.MockTransport(handler=router.handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        root = Navigator.discover("http://test.com/", settings)
+        results = NavigationPlan(plan_steps).execute(
+            root, [{"id": "1"}, {"order": "2"}, {"id": "4"}]
+        )
+
+        assert isinstance(results[0], Navigator)
+        assert isinstance(results[1], KeyError)
+        assert isinstance(results[2], Exception)
+
+    def test_async_plan(self):
+        async def run():
+            router = create_router()
+            transport = httpx.MockTransport(handler=router.handler)
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(transport=transport)
+            }
+
+            root = await AsyncNavigator.discover("http://test.com/", settings)
+            results = await AsyncNavigationPlan(plan_steps).execute(
+                root, [{"id": "1"}, {"id": "2"}, {"id": "1"}]
+            )
+
+            names = [
+                result.resource().get_property("name")
+                for result in results
+                if isinstance(result, AsyncNavigator)
+            ]
+            assert names == ["customer-1", "customer-2", "customer-1"]
+            assert requested_paths(router).count("/orders/1") == 1
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
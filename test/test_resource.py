@@ -1,7 +1,13 @@
+import io
 import sys
+import json
+import pickle
 import pytest
 
-from pyhalboy import Resource
+from array import array
+
+from pyhalboy import FrozenResource, Link, Resource
+from pyhalboy.resource import LazyResource, LinkDict
 
 
 def create_user(id, name):
@@ -130,6 +136,21 @@ class TestResource(object):
             "ea:address": resource2,
         }
 
+    def test_get_resources_returns_a_snapshot(self):
+        fred = create_user("fred", "Fred")
+        sue = create_user("sue", "Sue")
+        mary = create_user("mary", "Mary")
+        resource = Resource().add_resource("users", [fred, sue])
+
+        snapshot = resource.get_resources()
+        resource.add_resource("users", mary)
+        users = snapshot["users"]
+        assert isinstance(users, list)
+        users.append(mary)
+
+        assert snapshot == {"users": [fred, sue, mary]}
+        assert resource.get_resource("users") == [fred, sue, mary]
+
     def test_stack_resources(self):
         resource1 = Resource().add_links(
             {
@@ -219,6 +240,82 @@ class TestResource(object):
             "state": "processing",
         }
 
+    def test_add_links_bulk(self):
+        resource = (
+            Resource()
+            .add_link("item", "/items/0")
+            .add_links_bulk(
+                "item", ("/items/{}".format(i) for i in range(1, 4))
+            )
+        )
+
+        assert resource.get_href("item") == [
+            "/items/0",
+            "/items/1",
+            "/items/2",
+            "/items/3",
+        ]
+
+    def test_add_links_bulk_single(self):
+        resource = Resource().add_links_bulk("self", ["/orders"])
+
+        assert resource.get_link("self") == {"href": "/orders"}
+
+    def test_add_resources_bulk(self):
+        users = [create_user(i, "User {}".format(i)) for i in range(3)]
+        resource = (
+            Resource()
+            .add_resources_bulk("users", iter(users[:1]))
+            .add_resources_bulk("users", iter(users[1:]))
+        )
+
+        assert resource.get_resource("users") == users
+
+    def test_append_does_not_share_input_sequence(self):
+        links: list[LinkDict] = [{"href": "/items/1"}]
+        resource = Resource(links={"item": links}).add_link("item", "/items/2")
+
+        assert links == [{"href": "/items/1"}]
+        assert resource.get_href("item") == ["/items/1", "/items/2"]
+        assert resource.to_object() == {
+            "_links": {"item": [{"href": "/items/1"}, {"href": "/items/2"}]}
+        }
+
+    def test_iter_json(self):
+        resource = (
+            Resource()
+            .add_link("self", "/orders/123")
+            .add_link("ea:admin", {"href": "/admins/2", "title": "Fred"})
+            .add_link("ea:admin", Link("/admins/5", extra={"x-tag": [1, 2]}))
+            .add_property("state", 'dispatching "today"')
+            .add_property("total", {"amount": 10.5, "currency": None})
+            .add_resource("ea:basket", create_user("fred", "Fred"))
+            .add_resource(
+                "ea:item",
+                [create_user("sue", "Sue"), Resource().add_property("a", 1)],
+            )
+        )
+
+        assert "".join(resource.iter_json()) == json.dumps(
+            resource.to_object()
+        )
+
+    def test_iter_json_empty(self):
+        assert "".join(Resource().iter_json()) == "{}"
+        assert "".join(
+            Resource().add_property("a", []).iter_json()
+        ) == json.dumps({"a": []})
+
+    def test_write_json(self):
+        resource = create_user("fred", "Fred").add_resource(
+            "friends", [create_user("sue", "Sue")]
+        )
+        fp = io.StringIO()
+
+        resource.write_json(fp)
+
+        assert json.loads(fp.getvalue()) == resource.to_object()
+
     # def test_obj_to_resource(self):
     #     resource = (
     #         Resource()
@@ -277,5 +374,525 @@ class TestResource(object):
     #     assert obj_resource.get_property('state') == 'processing'
 
 
+def create_order_dict():
+    return {
+        "_links": {
+            "self": {"href": "/orders/123"},
+            "ea:customer": [
+                {"href": "/customers/1"},
+                {"href": "/customers/2"},
+            ],
+        },
+        "_embedded": {
+            "ea:item": [
+                {"_links": {"self": "/items/1"}, "price": 1},
+                {"_links": {"self": "/items/2"}, "price": 2},
+            ],
+            "ea:basket": {"_links": {"self": {"href": "/baskets/1"}}},
+        },
+        "state": "dispatching",
+    }
+
+
+def is_materialised(resource, name):
+    try:
+        object.__getattribute__(resource, name)
+    except AttributeError:
+        return False
+    return True
+
+
+class TestTrustedFromObject(object):
+    def test_matches_default_construction(self):
+        document = create_order_dict()
+
+        trusted = Resource.from_object(document, trusted=True)
+        default = Resource.from_object(document)
+
+        assert trusted.to_object() == default.to_object()
+        assert trusted.get_hrefs() == default.get_hrefs()
+        assert trusted.get_links() == default.get_links()
+
+    def test_link_arrays_match_every_path(self):
+        document = {
+            "_links": {
+                "self": {"href": "/orders"},
+                "item": [{"href": "/a"}],
+                "many": [{"href": "/b"}, {"href": "/c"}],
+                "empty": [],
+            },
+            "_embedded": {"one": [{"id": 1}], "none": []},
+        }
+
+        resources = [
+            Resource.from_object(document),
+            Resource.from_object(document, lazy=True),
+            Resource.from_object(document, trusted=True),
+        ]
+
+        for resource in resources:
+            assert resource.to_object() == resources[0].to_object()
+            assert resource.get_hrefs() == resources[0].get_hrefs()
+            assert resource.get_href("item") == "/a"
+            assert not resource.has_link("empty")
+
+    def test_links_with_attributes(self):
+        document = {
+            "_links": {
+                "self": {"href": "/orders/1", "title": "Order", "x": 1},
+                "empty": {"href": "/empty", "name": None},
+            }
+        }
+
+        trusted = Resource.from_object(document, trusted=True)
+
+        assert trusted.to_object() == document
+
+    def test_does_not_share_input(self):
+        document = create_order_dict()
+        trusted = Resource.from_object(document, trusted=True)
+
+        trusted.add_link("ea:customer", "/customers/3")
+        trusted.add_property("state", "delivered")
+
+        assert document == create_order_dict()
+
+    def test_links_are_built_on_demand(self):
+        document = create_order_dict()
+        trusted = Resource.from_object(document, trusted=True)
+
+        assert (
+            trusted.to_object() == Resource.from_object(document).to_object()
+        )
+        assert trusted.has_link("self")
+        assert not is_materialised(trusted, "_links")
+
+        assert trusted.get_href("self") == "/orders/123"
+        assert is_materialised(trusted, "_links")
+        assert (
+            trusted.to_object() == Resource.from_object(document).to_object()
+        )
+
+    def test_from_json(self):
+        data = json.dumps(create_order_dict())
+
+        trusted = Resource.from_json(data, trusted=True)
+
+        assert trusted.to_object() == Resource.from_json(data).to_object()
+
+
+class TestLinkIndex(object):
+    def create_resource(self):
+        return Resource().add_links(
+            {
+                "self": "/orders/123",
+                "ea:customer": [
+                    {"href": "/customers/1", "name": "first", "title": "A"},
+                    {"href": "/customers/2", "name": "second", "title": "B"},
+                ],
+                "ea:owner": "/customers/1",
+            }
+        )
+
+    def test_get_link_by_name(self):
+        resource = self.create_resource()
+
+        assert resource.get_link_by_name("ea:customer", "second") == {
+            "href": "/customers/2",
+            "name": "second",
+            "title": "B",
+        }
+
+        with pytest.raises(KeyError):
+            resource.get_link_by_name("ea:customer", "third")
+
+    def test_get_link_by_title(self):
+        resource = self.create_resource()
+
+        assert resource.get_link_by_title("ea:customer", "A")["href"] == (
+            "/customers/1"
+        )
+
+    def test_get_rels(self):
+        resource = self.create_resource()
+
+        assert resource.get_rels("/customers/1") == ["ea:customer", "ea:owner"]
+        assert resource.get_rels("/customers/3") == []
+
+    def test_index_is_updated_on_mutation(self):
+        resource = self.create_resource()
+        assert resource.get_href("ea:customer") == [
+            "/customers/1",
+            "/customers/2",
+        ]
+
+        resource.add_link("ea:customer", {"href": "/customers/3", "name": "x"})
+        resource.add_links_bulk("ea:basket", ["/baskets/1"])
+
+        assert resource.get_href("ea:customer") == [
+            "/customers/1",
+            "/customers/2",
+            "/customers/3",
+        ]
+        assert resource.get_link_by_name("ea:customer", "x")["href"] == (
+            "/customers/3"
+        )
+        assert resource.get_rels("/baskets/1") == ["ea:basket"]
+
+    def test_index_is_updated_in_place(self):
+        resource = self.create_resource()
+        index = resource._index()
+
+        resource.add_link("ea:owner", {"href": "/customers/2", "title": "C"})
+        resource.add_links_bulk("ea:customer", ["/customers/3"])
+        resource.add_links(
+            {"ea:basket": [{"href": "/baskets/1"}, {"href": "/baskets/2"}]}
+        )
+
+        assert resource._index() is index
+        assert resource.get_href("ea:owner") == [
+            "/customers/1",
+            "/customers/2",
+        ]
+        assert resource.get_href("ea:customer") == [
+            "/customers/1",
+            "/customers/2",
+            "/customers/3",
+        ]
+        assert resource.get_href("ea:basket") == ["/baskets/1", "/baskets/2"]
+        assert resource.get_link_by_title("ea:owner", "C")["href"] == (
+            "/customers/2"
+        )
+        assert resource.get_rels("/customers/2") == ["ea:customer", "ea:owner"]
+        assert resource.get_rels("/customers/3") == ["ea:customer"]
+
+    def test_link_dicts_are_updated_on_mutation(self):
+        resource = self.create_resource()
+        assert resource.get_link("ea:owner") == {"href": "/customers/1"}
+        assert len(resource.get_link("ea:customer")) == 2
+
+        resource.add_link("ea:owner", "/customers/2")
+        resource.add_links_bulk("ea:customer", ["/customers/3"])
+        resource.add_link("ea:basket", "/baskets/1")
+
+        assert resource.get_link("ea:owner") == [
+            {"href": "/customers/1"},
+            {"href": "/customers/2"},
+        ]
+        assert resource.get_link("ea:customer") == [
+            {"href": "/customers/1", "name": "first", "title": "A"},
+            {"href": "/customers/2", "name": "second", "title": "B"},
+            {"href": "/customers/3"},
+        ]
+        assert list(resource.to_object()["_links"]) == [
+            "self",
+            "ea:customer",
+            "ea:owner",
+            "ea:basket",
+        ]
+
+    def test_returned_hrefs_are_copies(self):
+        resource = self.create_resource()
+
+        hrefs = resource.get_href("ea:customer")
+        assert isinstance(hrefs, list)
+        hrefs.append("/customers/4")
+
+        assert resource.get_href("ea:customer") == [
+            "/customers/1",
+            "/customers/2",
+        ]
+
+    def test_lazy_resource(self):
+        resource = Resource.from_object(
+            Resource()
+            .add_link("item", {"href": "/items/1", "name": "one"})
+            .to_object(),
+            lazy=True,
+        )
+
+        assert resource.get_link_by_name("item", "one")["href"] == "/items/1"
+
+
+class TestFrozenResource(object):
+    def test_freeze_matches_resource(self):
+        resource = Resource.from_object(create_order_dict())
+        frozen = resource.freeze()
+
+        assert isinstance(frozen, FrozenResource)
+        assert frozen.to_object() == resource.to_object()
+        assert frozen.get_hrefs() == {
+            rel: tuple(hrefs) if isinstance(hrefs, list) else hrefs
+            for rel, hrefs in resource.get_hrefs().items()
+        }
+        assert frozen.freeze() is frozen
+
+    def test_freeze_is_detached_from_source(self):
+        resource = Resource().add_link("item", "/items/1")
+        frozen = resource.freeze()
+
+        resource.add_link("item", "/items/2").add_property("state", "new")
+
+        assert frozen.get_href("item") == "/items/1"
+        assert frozen.get_properties() == {}
+
+    def test_accessors_return_read_only_views(self):
+        frozen = (
+            Resource()
+            .add_links_bulk("item", ["/items/1", "/items/2"])
+            .add_resources_bulk("users", [create_user(1, "Fred")])
+            .add_property("state", "new")
+            .freeze()
+        )
+
+        properties = frozen.get_properties()
+        resources = frozen.get_resources()
+        users = frozen.get_resource("users")
+
+        with pytest.raises(TypeError):
+            properties["state"] = "old"  # type: ignore
+        with pytest.raises(TypeError):
+            resources["users"] = []  # type: ignore
+        assert isinstance(users, tuple)
+        assert frozen.get_href("item") == ("/items/1", "/items/2")
+        assert frozen.get_resource("users") is users
+
+    def test_link_dicts_are_built_once(self):
+        frozen = Resource.from_object(create_order_dict()).freeze()
+
+        customers = frozen.get_link("ea:customer")
+        links = frozen.get_links()
+
+        assert customers == (
+            {"href": "/customers/1"},
+            {"href": "/customers/2"},
+        )
+        assert frozen.get_link("ea:customer") is customers
+        assert links["ea:customer"] is customers
+        assert frozen.get_link("self") is frozen.get_link("self")
+        with pytest.raises(TypeError):
+            links["self"] = {"href": "/orders/2"}  # type: ignore
+        assert frozen.to_object()["_links"]["ea:customer"] == [
+            {"href": "/customers/1"},
+            {"href": "/customers/2"},
+        ]
+
+    def test_add_returns_new_instances(self):
+        frozen = FrozenResource(
+            properties={"state": "new"},
+            links={"self": {"href": "/orders/1"}},
+            embedded={"items": [Resource().add_property("id", 1)]},
+        )
+
+        updated = (
+            frozen.add_link("self", "/orders/2")
+            .add_property("state", "dispatched")
+            .add_resource("items", Resource().add_property("id", 2))
+        )
+
+        assert frozen.to_object() == {
+            "_links": {"self": {"href": "/orders/1"}},
+            "state": "new",
+            "_embedded": {"items": [{"id": 1}]},
+        }
+        assert updated.to_object() == {
+            "_links": {"self": [{"href": "/orders/1"}, {"href": "/orders/2"}]},
+            "state": "dispatched",
+            "_embedded": {"items": [{"id": 1}, {"id": 2}]},
+        }
+        assert isinstance(updated, FrozenResource)
+
+    def test_unchanged_structure_is_shared(self):
+        frozen = Resource.from_object(create_order_dict()).freeze()
+        hrefs = frozen.get_href("ea:customer")
+
+        updated = frozen.add_property("state", "dispatched")
+
+        assert updated.get_resource("ea:basket") is frozen.get_resource(
+            "ea:basket"
+        )
+        assert updated.get_href("ea:customer") is hrefs
+
+    def test_add_links_bulk(self):
+        frozen = FrozenResource().add_links(
+            {
+                "single": [{"href": "/a"}],
+                "many": [{"href": "/b"}, {"href": "/c"}],
+                "plain": "/d",
+            }
+        )
+
+        assert frozen.get_links() == {
+            "single": {"href": "/a"},
+            "many": ({"href": "/b"}, {"href": "/c"}),
+            "plain": {"href": "/d"},
+        }
+
+    def test_pickle(self):
+        frozen = Resource.from_object(create_order_dict()).freeze()
+
+        restored = pickle.loads(pickle.dumps(frozen))
+
+        assert isinstance(restored, FrozenResource)
+        assert restored.to_object() == frozen.to_object()
+
+
+class TestLazyResource(object):
+    def test_from_object_lazy(self):
+        resource = Resource.from_object(create_order_dict(), lazy=True)
+
+        assert isinstance(resource, LazyResource)
+        assert resource.get_href("self") == "/orders/123"
+        assert is_materialised(resource, "_links")
+        assert not is_materialised(resource, "_properties")
+        assert not is_materialised(resource, "_embedded")
+
+    def test_embedded_resources_are_lazy(self):
+        resource = Resource.from_object(create_order_dict(), lazy=True)
+
+        items = resource.get_resource("ea:item")
+
+        assert isinstance(items, list)
+        assert all(isinstance(item, LazyResource) for item in items)
+        assert not is_materialised(items[1], "_links")
+        assert items[1].get_property("price") == 2
+        assert items[1].get_link("self") == {"href": "/items/2"}
+
+    def test_matches_eager_resource(self):
+        lazy = Resource.from_object(create_order_dict(), lazy=True)
+        eager = Resource.from_object(create_order_dict())
+
+        assert lazy.to_object() == eager.to_object()
+        assert lazy.get_hrefs() == eager.get_hrefs()
+        assert lazy.get_properties() == eager.get_properties()
+
+    def test_mutation(self):
+        resource = Resource.from_object(create_order_dict(), lazy=True)
+
+        resource.add_link("ea:customer", "/customers/3")
+        resource.add_property("state", "delivered")
+
+        assert resource.get_href("ea:customer") == [
+            "/customers/1",
+            "/customers/2",
+            "/customers/3",
+        ]
+        assert resource.get_property("state") == "delivered"
+
+    def test_pickle(self):
+        resource = Resource.from_object(create_order_dict(), lazy=True)
+        resource.get_href("self")
+
+        restored = pickle.loads(pickle.dumps(resource))
+
+        assert restored.to_object() == resource.to_object()
+
+
+def create_orders_dict():
+    return {
+        "_links": {"self": {"href": "/orders"}},
+        "_embedded": {
+            "ea:order": [
+                {
+                    "_links": {
+                        "self": {"href": "/orders/1"},
+                        "ea:basket": [{"href": "/baskets/1"}],
+                    },
+                    "total": 30,
+                    "status": "shipped",
+                },
+                {
+                    "_links": {"self": {"href": "/orders/2"}},
+                    "total": 20,
+                },
+            ]
+        },
+    }
+
+
+class TestEmbeddedColumns(object):
+    def test_columns(self):
+        resource = Resource.from_object(create_orders_dict())
+
+        columns = resource.embedded_columns(
+            "ea:order",
+            fields=["total", "status"],
+            hrefs=["self", "ea:basket"],
+            format="list",
+        )
+
+        assert columns == {
+            "total": [30, 20],
+            "status": ["shipped", None],
+            "self": ["/orders/1", "/orders/2"],
+            "ea:basket": ["/baskets/1", None],
+        }
+
+    def test_numeric_columns_use_arrays(self):
+        resource = Resource.from_object(create_orders_dict())
+
+        columns = resource.embedded_columns("ea:order", fields=["total"])
+
+        assert columns["total"] == array("q", [30, 20])
+
+    def test_missing_rel(self):
+        resource = Resource.from_object(create_orders_dict())
+
+        assert resource.embedded_columns(
+            "ea:customer", fields=["name"], format="list"
+        ) == {"name": []}
+
+    def test_lazy_matches_eager(self):
+        eager = Resource.from_object(create_orders_dict())
+        lazy = Resource.from_object(create_orders_dict(), lazy=True)
+        fields = ["total", "status"]
+        hrefs = ["self", "ea:basket"]
+
+        assert lazy.embedded_columns(
+            "ea:order", fields, hrefs
+        ) == eager.embedded_columns("ea:order", fields, hrefs)
+
+    def test_lazy_does_not_materialise(self):
+        resource = Resource.from_object(create_orders_dict(), lazy=True)
+        assert isinstance(resource, LazyResource)
+
+        resource.embedded_columns("ea:order", fields=["total"])
+
+        assert not resource._is_materialised("_embedded")
+
+    def test_lazy_sees_mutations(self):
+        resource = Resource.from_object(create_orders_dict(), lazy=True)
+        resource.add_resource(
+            "ea:order", Resource().add_link("self", "/orders/3")
+        )
+
+        columns = resource.embedded_columns("ea:order", hrefs=["self"])
+
+        assert columns["self"] == ["/orders/1", "/orders/2", "/orders/3"]
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        resource = Resource.from_object(create_orders_dict())
+
+        columns = resource.embedded_columns(
+            "ea:order", fields=["total"], format="numpy"
+        )
+
+        assert numpy.array_equal(columns["total"], numpy.array([30, 20]))
+
+    def test_arrow(self):
+        pytest.importorskip("pyarrow")
+        resource = Resource.from_object(create_orders_dict())
+
+        table = resource.embedded_columns(
+            "ea:order", fields=["status"], hrefs=["self"], format="arrow"
+        )
+
+        assert table.to_pydict() == {
+            "status": ["shipped", None],
+            "self": ["/orders/1", "/orders/2"],
+        }
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__]))
@@ -0,0 +1,253 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+
+from pyhalboy import AsyncNavigator, Navigator
+from pyhalboy.async_navigator import AsyncSettingsDict
+from pyhalboy.navigator import SettingsDict
+from pyhalboy.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+root_json = {"_links": {"users": {"href": "/users"}}}
+
+
+class FlakyServer(object):
+    def __init__(self, failures: list[int | Exception]):
+        self.failures = list(failures)
+        self.calls: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append("{} {}".format(request.method, request.url.path))
+        if request.url.path == "/users" and self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure, json={})
+        if request.url.path == "/":
+            return httpx.Response(200, json=root_json)
+        return httpx.Response(200, json={"count": 1})
+
+
+def create_settings(
+    server: FlakyServer, policy: RetryPolicy | None = None
+) -> SettingsDict:
+    return {
+        "client": httpx.Client(transport=httpx.MockTransport(server.handler)),
+        "retry": (
+            policy
+            if policy is not None
+            else RetryPolicy(backoff_factor=0, circuit_breaker=None)
+        ),
+    }
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryPolicy(object):
+    def test_get_is_retried_on_transient_status(self):
+        server = FlakyServer([503, 502])
+
+        navigator = Navigator.discover(
+            "http://test.com/", create_settings(server)
+        )
+        users = navigator.get("users")
+
+        assert users.status() == 200
+        assert server.calls == ["GET /"] + ["GET /users"] * 3
+
+    def test_gives_up_after_max_attempts(self):
+        server = FlakyServer([503, 503, 503])
+
+        navigator = Navigator.discover(
+            "http://test.com/", create_settings(server)
+        )
+
+        assert navigator.get("users").status() == 503
+        assert server.calls.count("GET /users") == 3
+
+    def test_post_is_not_retried_on_status(self):
+        server = FlakyServer([503])
+
+        navigator = Navigator.discover(
+            "http://test.com/", create_settings(server)
+        )
+
+        assert navigator.post("users", {}).status() == 503
+        assert server.calls == ["GET /", "POST /users"]
+
+    def test_post_is_retried_when_not_sent(self):
+        request = httpx.Request("POST", "http://test.com/users")
+        server = FlakyServer([httpx.ConnectError("refused", request=request)])
+
+        navigator = Navigator.discover(
+            "http://test.com/", create_settings(server)
+        )
+
+        assert navigator.post("users", {}).status() == 200
+        assert server.calls == ["GET /", "POST /users", "POST /users"]
+
+    def test_post_is_not_retried_after_read_error(self):
+        request = httpx.Request("POST", "http://test.com/users")
+        server = FlakyServer([httpx.ReadError("reset", request=request)])
+
+        navigator = Navigator.discover(
+            "http://test.com/", create_settings(server)
+        )
+
+        with pytest.raises(httpx.ReadError):
+            navigator.post("users", {})
+
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(1, 5)] == [
+            1,
+            2,
+            4,
+            5,
+        ]
+
+    def test_backoff_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+        assert all(0 <= policy.backoff(3) <= 4 for _ in range(20))
+
+    def test_retry_after_is_respected(self):
+        policy = RetryPolicy(max_backoff=10, circuit_breaker=None)
+        request = httpx.Request("GET", "http://test.com/users")
+
+        short = httpx.Response(503, headers={"retry-after": "2"})
+        long = httpx.Response(503, headers={"retry-after": "60"})
+
+        assert policy.delay_after_response(request, short, 1) == 2
+        assert policy.delay_after_response(request, long, 1) is None
+
+    def test_circuit_opens_per_host(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=2, recovery_time=10, clock=clock
+        )
+        server = FlakyServer([503, 503, 503, 503])
+        settings = create_settings(
+            server,
+            RetryPolicy(
+                max_attempts=2, backoff_factor=0, circuit_breaker=breaker
+            ),
+        )
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        assert navigator.get("users").status() == 503
+        assert breaker.is_open("test.com")
+
+        with pytest.raises(CircuitOpenError):
+            navigator.get("users")
+        assert server.calls.count("GET /users") == 2
+        assert breaker.allow("other.com")
+
+        clock.now = 10
+        server.failures = []
+        assert navigator.get("users").status() == 200
+        assert not breaker.is_open("test.com")
+
+    def test_circuit_allows_a_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_time=10, clock=clock
+        )
+
+        breaker.record_failure("test.com")
+        assert not breaker.allow("test.com")
+
+        clock.now = 10
+        assert breaker.allow("test.com")
+        assert not breaker.allow("test.com")
+
+        breaker.record_failure("test.com")
+        clock.now = 15
+        assert not breaker.allow("test.com")
+
+    def test_probe_ending_in_other_errors_releases_the_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_time=10, clock=clock
+        )
+        server = FlakyServer([503, httpx.TooManyRedirects("loop")])
+        settings = create_settings(
+            server,
+            RetryPolicy(
+                max_attempts=1, backoff_factor=0, circuit_breaker=breaker
+            ),
+        )
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        navigator.get("users")
+        assert breaker.is_open("test.com")
+
+        clock.now = 10
+        with pytest.raises(httpx.TooManyRedirects):
+            navigator.get("users")
+        assert breaker.allow("test.com")
+
+    def test_probe_failing_in_a_hook_releases_the_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_time=10, clock=clock
+        )
+
+        failing = []
+
+        def hook(request: httpx.Request) -> None:
+            if failing:
+                raise RuntimeError("hook")
+
+        server = FlakyServer([503])
+        settings: SettingsDict = {
+            **create_settings(
+                server,
+                RetryPolicy(
+                    max_attempts=1, backoff_factor=0, circuit_breaker=breaker
+                ),
+            ),
+            "before_request": [hook],
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        navigator.get("users")
+        assert breaker.is_open("test.com")
+
+        clock.now = 10
+        failing.append(True)
+        with pytest.raises(RuntimeError):
+            navigator.get("users")
+        assert breaker.allow("test.com")
+
+    def test_async_get_is_retried(self):
+        async def run():
+            server = FlakyServer([503])
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(
+                    transport=httpx.MockTransport(server.handler)
+                ),
+                "retry": RetryPolicy(backoff_factor=0),
+            }
+
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+            users = await navigator.get("users")
+
+            assert users.status() == 200
+            assert server.calls.count("GET /users") == 2
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,98 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+import respx
+
+from pyhalboy.session import AsyncNavigatorSession, NavigatorSession
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200, json={"_links": {"users": {"href": "/users"}}}
+        )
+    )
+    router.get("/users").mock(
+        return_value=httpx.Response(200, json={"count": 3})
+    )
+    return router
+
+
+class TestNavigatorSession(object):
+    def test_discover_shares_client(self):
+        transport = httpx.MockTransport(handler=create_router().handler)
+
+        with NavigatorSession(transport=transport) as session:
+            navigator = session.discover("http://test.com/")
+            users = navigator.get("users")
+
+            assert users.status() == 200
+            assert users.resource().get_property("count") == 3
+            assert navigator._settings.client is session.client
+            assert users._settings.client is session.client
+
+        assert session.closed
+
+    def test_settings_headers_are_sent(self):
+        requests: list[httpx.Request] = []
+        router = create_router()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return router.handler(request)
+
+        with NavigatorSession(
+            {"http": {"headers": {"authorization": "some-token"}}},
+            transport=httpx.MockTransport(handler=handler),
+        ) as session:
+            session.discover("http://test.com/").get("users")
+
+        assert [request.headers["authorization"] for request in requests] == [
+            "some-token",
+            "some-token",
+        ]
+
+    def test_async_settings_headers_are_sent(self):
+        requests: list[httpx.Request] = []
+        router = create_router()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return await router.async_handler(request)
+
+        async def run():
+            async with AsyncNavigatorSession(
+                {"http": {"headers": {"authorization": "some-token"}}},
+                transport=httpx.MockTransport(handler=handler),
+            ) as session:
+                navigator = await session.discover("http://test.com/")
+                await navigator.get("users")
+
+        asyncio.run(run())
+
+        assert [request.headers["authorization"] for request in requests] == [
+            "some-token",
+            "some-token",
+        ]
+
+    def test_async_discover_shares_client(self):
+        async def run():
+            transport = httpx.MockTransport(handler=create_router().handler)
+
+            async with AsyncNavigatorSession(transport=transport) as session:
+                navigator = await session.discover("http://test.com/")
+                users = await navigator.get("users")
+
+                assert users.resource().get_property("count") == 3
+                assert users._settings.client is session.client
+
+            assert session.closed
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
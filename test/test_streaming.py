@@ -0,0 +1,224 @@
+import sys
+import json
+import asyncio
+import pytest
+
+import httpx
+
+from pyhalboy.async_navigator import AsyncNavigator
+from pyhalboy.navigator import Navigator, SettingsDict
+from pyhalboy.resource import Resource
+from pyhalboy.retry import RetryPolicy
+from pyhalboy.streaming import EmbeddedStreamParser
+
+
+def create_user(id, name):
+    return (
+        Resource()
+        .add_link("self", "/users/{}".format(id))
+        .add_property("name", name)
+    )
+
+
+def create_users_body(count):
+    return json.dumps(
+        Resource()
+        .add_link("self", "/users")
+        .add_link("next", "/users?page=2")
+        .add_resource(
+            "users",
+            [
+                create_user(i, 'User "{}" [{}]'.format(i, i))
+                for i in range(count)
+            ],
+        )
+        .add_property("total", count)
+        .to_object()
+    ).encode()
+
+
+def feed_in_chunks(parser, body, size):
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start : start + size]))
+    return items
+
+
+async def async_iter(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def create_handler(body, chunked=iter):
+    def handler(request):
+        if request.url.path == "/":
+            return httpx.Response(
+                200,
+                json={
+                    "_links": {
+                        "users": {"href": "/users"},
+                        "broken": {"href": "/broken"},
+                    }
+                },
+            )
+        if request.url.path == "/broken":
+            return httpx.Response(500)
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        return httpx.Response(200, content=chunked(chunks))
+
+    return handler
+
+
+class TestEmbeddedStreamParser(object):
+    def test_yields_items_across_chunk_boundaries(self):
+        body = create_users_body(5)
+
+        for size in [1, 3, 16, len(body)]:
+            items = feed_in_chunks(EmbeddedStreamParser("users"), body, size)
+
+            assert items == json.loads(body)["_embedded"]["users"]
+
+    def test_single_embedded_resource(self):
+        body = json.dumps(
+            {
+                "_embedded": {
+                    "other": [{"name": "ignored"}],
+                    "owner": {"name": "Fred", "_embedded": {"owner": {}}},
+                },
+            }
+        ).encode()
+
+        items = feed_in_chunks(EmbeddedStreamParser("owner"), body, 4)
+
+        assert items == [{"name": "Fred", "_embedded": {"owner": {}}}]
+
+    def test_ignores_rel_outside_embedded(self):
+        body = json.dumps(
+            {
+                "users": [{"name": "not embedded"}],
+                "_links": {"users": {"href": "/users"}},
+                "_embedded": {"users": [{"name": "Fred"}]},
+            }
+        ).encode()
+
+        items = feed_in_chunks(EmbeddedStreamParser("users"), body, 5)
+
+        assert items == [{"name": "Fred"}]
+
+    def test_escaped_keys(self):
+        body = b'{"_embedded": {"us\\u0065rs": [{"name": "Fred"}]}}'
+
+        items = feed_in_chunks(EmbeddedStreamParser("users"), body, 2)
+
+        assert items == [{"name": "Fred"}]
+
+
+class RecordingSpan(object):
+    def __init__(self, name, ended):
+        self.name = name
+        self.ended = ended
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self):
+        self.ended.append(self.name)
+
+
+class RecordingTracer(object):
+    def __init__(self):
+        self.ended = []
+
+    def start_span(self, name, *, attributes):
+        return RecordingSpan(name, self.ended)
+
+
+class TestNavigatorStreamEmbedded(object):
+    def test_stream_embedded(self):
+        client = httpx.Client(
+            transport=httpx.MockTransport(create_handler(create_users_body(4)))
+        )
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+
+        users = list(navigator.stream_embedded("users"))
+
+        assert [user.get_href("self") for user in users] == [
+            "/users/0",
+            "/users/1",
+            "/users/2",
+            "/users/3",
+        ]
+
+    def test_stream_embedded_error(self):
+        client = httpx.Client(
+            transport=httpx.MockTransport(create_handler(b""))
+        )
+        navigator = Navigator.discover(
+            "http://test.com/", settings={"client": client}
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            list(navigator.stream_embedded("broken"))
+
+    def test_stream_embedded_goes_through_send(self):
+        body = create_users_body(2)
+        handler = create_handler(body)
+        failures = [503]
+
+        def flaky_handler(request):
+            if request.url.path == "/users" and failures:
+                return httpx.Response(failures.pop())
+            return handler(request)
+
+        before = []
+        after = []
+        tracer = RecordingTracer()
+        settings: SettingsDict = {
+            "client": httpx.Client(
+                transport=httpx.MockTransport(flaky_handler)
+            ),
+            "before_request": [lambda request: before.append(request)],
+            "after_request": [
+                lambda request, response, elapsed: after.append(
+                    response.status_code
+                )
+            ],
+            "tracer": tracer,
+            "retry": RetryPolicy(backoff_factor=0, circuit_breaker=None),
+        }
+        navigator = Navigator.discover("http://test.com/", settings)
+
+        users = list(navigator.stream_embedded("users"))
+
+        assert len(users) == 2
+        assert len(before) == 3
+        assert after == [200, 503, 200]
+        assert tracer.ended == ["GET", "GET", "GET"]
+
+    def test_async_stream_embedded(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                create_handler(create_users_body(3), async_iter)
+            )
+        )
+
+        async def run():
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings={"client": client}
+            )
+            return [
+                user.get_property("name")
+                async for user in navigator.stream_embedded("users")
+            ]
+
+        assert asyncio.run(run()) == [
+            'User "0" [0]',
+            'User "1" [1]',
+            'User "2" [2]',
+        ]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,191 @@
+import sys
+import asyncio
+import pytest
+
+import httpx
+import respx
+
+from collections.abc import Mapping
+
+from pyhalboy import AsyncNavigator, Navigator
+from pyhalboy.async_navigator import AsyncSettingsDict
+from pyhalboy.navigator import SettingsDict
+from pyhalboy.tracing import AttributeValue, Timings
+
+
+class RecordingSpan(object):
+    def __init__(self, name: str, attributes: Mapping[str, AttributeValue]):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.ended = False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class RecordingTracer(object):
+    def __init__(self):
+        self.spans: list[RecordingSpan] = []
+
+    def start_span(
+        self, name: str, *, attributes: Mapping[str, AttributeValue]
+    ) -> RecordingSpan:
+        span = RecordingSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+
+def create_router():
+    router = respx.Router(base_url="http://test.com")
+    router.get("/").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "_links": {
+                    "user": {"href": "/users/{id}", "templated": True},
+                    "users": {"href": "/users"},
+                }
+            },
+        )
+    )
+    router.get("/users/thomas").mock(
+        return_value=httpx.Response(200, json={"name": "Thomas"})
+    )
+    router.post("/users").mock(
+        return_value=httpx.Response(201, json={"name": "Thomas"})
+    )
+    return router
+
+
+class TestTracing(object):
+    def test_hooks_are_called_around_each_request(self):
+        transport = httpx.MockTransport(handler=create_router().handler)
+        before: list[str] = []
+        after: list[tuple[str, int, float]] = []
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=transport),
+            "before_request": [
+                lambda request: before.append(str(request.url))
+            ],
+            "after_request": [
+                lambda request, response, elapsed: after.append(
+                    (request.method, response.status_code, elapsed)
+                )
+            ],
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        navigator.get("user", {"id": "thomas"})
+        navigator.post("users", {"name": "Thomas"})
+
+        assert before == [
+            "http://test.com/",
+            "http://test.com/users/thomas",
+            "http://test.com/users",
+        ]
+        assert [(method, status) for method, status, _ in after] == [
+            ("GET", 200),
+            ("GET", 200),
+            ("POST", 201),
+        ]
+        assert all(elapsed >= 0 for _, _, elapsed in after)
+
+    def test_tracer_records_a_span_per_request(self):
+        transport = httpx.MockTransport(handler=create_router().handler)
+        tracer = RecordingTracer()
+
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=transport),
+            "tracer": tracer,
+        }
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        navigator.post("users", {"name": "Thomas"})
+
+        assert [span.name for span in tracer.spans] == ["GET", "POST"]
+        assert all(span.ended for span in tracer.spans)
+        assert tracer.spans[1].attributes == {
+            "http.request.method": "POST",
+            "url.full": "http://test.com/users",
+            "http.response.status_code": 201,
+        }
+
+    def test_tracer_records_errors(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        tracer = RecordingTracer()
+        settings: SettingsDict = {
+            "client": httpx.Client(transport=httpx.MockTransport(handler)),
+            "tracer": tracer,
+        }
+
+        with pytest.raises(httpx.ConnectError):
+            Navigator.discover("http://test.com/", settings)
+
+        assert tracer.spans[0].ended
+        assert tracer.spans[0].attributes["error.type"] == "ConnectError"
+
+    def test_timings_are_broken_down_per_phase(self):
+        transport = httpx.MockTransport(handler=create_router().handler)
+        settings: SettingsDict = {"client": httpx.Client(transport=transport)}
+
+        navigator = Navigator.discover("http://test.com/", settings)
+        user = navigator.get("user", {"id": "thomas"})
+        assert user.timings().decode == 0
+
+        user.resource()
+        timings = user.timings()
+
+        assert timings.template_resolution > 0
+        assert timings.network > 0
+        assert timings.decode > 0
+        assert timings.resource_build > 0
+        assert timings.total == pytest.approx(
+            timings.template_resolution
+            + timings.network
+            + timings.decode
+            + timings.resource_build
+        )
+        assert navigator.timings().template_resolution == 0
+
+    def test_timings_default_to_zero(self):
+        assert Timings().total == 0
+
+    def test_async_hooks_and_tracer(self):
+        async def run():
+            transport = httpx.MockTransport(handler=create_router().handler)
+            tracer = RecordingTracer()
+            statuses: list[int] = []
+
+            settings: AsyncSettingsDict = {
+                "client": httpx.AsyncClient(transport=transport),
+                "tracer": tracer,
+                "after_request": [
+                    lambda request, response, elapsed: statuses.append(
+                        response.status_code
+                    )
+                ],
+            }
+
+            navigator = await AsyncNavigator.discover(
+                "http://test.com/", settings
+            )
+            user = await navigator.get("user", {"id": "thomas"})
+
+            assert statuses == [200, 200]
+            assert [span.attributes["url.full"] for span in tracer.spans] == [
+                "http://test.com/",
+                "http://test.com/users/thomas",
+            ]
+            assert user.timings().network > 0
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))